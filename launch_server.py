@@ -15,22 +15,308 @@ Arguments:
 Author: AI Assistant
 """
 
+import argparse
+import io
+import mimetypes
+import mmap
 import os
+import re
+import stat
 import sys
+import signal
 import socket
+import subprocess
 import threading
 import time
 import logging
+import functools
+import zlib
+from collections import OrderedDict
 from pathlib import Path
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from types import SimpleNamespace
+from typing import Dict, Tuple
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+# Load the system MIME registry once at import rather than on the first request
+mimetypes.init()
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+# URL paths made only of plain segments: no percent-escapes, no empty, "." or ".." segments
+_SIMPLE_URL_PATH = re.compile(r'(?:/[A-Za-z0-9_\-][A-Za-z0-9_.\-]*)*/?')
+
+
+@functools.lru_cache(maxsize=1024)
+def _translate_path(directory: str, path: str) -> str:
+    """Cached SimpleHTTPRequestHandler.translate_path for a given serve directory"""
+    url_path = path.split('?', 1)[0].split('#', 1)[0]
+    if _SIMPLE_URL_PATH.fullmatch(url_path):
+        # Nothing to unquote or normalise, so join the segments onto the root directly
+        segments = url_path.strip('/')
+        translated = os.path.join(directory, *segments.split('/')) if segments else directory
+        return translated + '/' if url_path.endswith('/') else translated
+    
+    # The stdlib implementation only reads `directory` from the handler instance
+    return SimpleHTTPRequestHandler.translate_path(SimpleNamespace(directory=directory), path)
+
+
+# Text-like assets worth gzip-compressing when the client accepts it
+_COMPRESSIBLE_EXTENSIONS = {'.html', '.htm', '.js', '.mjs', '.css', '.svg', '.json', '.txt', '.xml', '.map'}
+# Compressed bodies keyed on path -> (mtime_ns, size, gzip bytes), bounded by total byte size
+_gzip_cache: "OrderedDict[str, Tuple[int, int, bytes]]" = OrderedDict()
+_gzip_cache_bytes = 0
+_GZIP_CACHE_LIMIT = 64 * 1024 * 1024
+_gzip_cache_lock = threading.Lock()
+# Files up to this size are read into memory instead of mapped, keeping the mapping off small assets
+_GZIP_MMAP_MIN_SIZE = 1024 * 1024
+
+
+def _gzip_file(path: str, st: os.stat_result) -> bytes:
+    """Return the gzip-compressed contents of a file, reusing the cached copy while it is unchanged"""
+    global _gzip_cache_bytes
+    with _gzip_cache_lock:
+        cached = _gzip_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _gzip_cache.move_to_end(path)
+            return cached[2]
+    
+    # Level 1: the cheapest deflate level, so a cold asset is served without a noticeable compression stall
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    body = None
+    with open(path, 'rb') as f:
+        if st.st_size > _GZIP_MMAP_MIN_SIZE:
+            # Compress large files straight from the page cache rather than copying them into a bytes object
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    body = compressor.compress(mapped) + compressor.flush()
+            except ValueError:
+                # The file was truncated to empty since the stat (editors do this while saving)
+                pass
+        if body is None:
+            body = compressor.compress(f.read()) + compressor.flush()
+    
+    with _gzip_cache_lock:
+        previous = _gzip_cache.pop(path, None)
+        if previous is not None:
+            _gzip_cache_bytes -= len(previous[2])
+        if len(body) <= _GZIP_CACHE_LIMIT:
+            _gzip_cache[path] = (st.st_mtime_ns, st.st_size, body)
+            _gzip_cache_bytes += len(body)
+            while _gzip_cache_bytes > _GZIP_CACHE_LIMIT:
+                _, (_, _, evicted) = _gzip_cache.popitem(last=False)
+                _gzip_cache_bytes -= len(evicted)
+    return body
+
+
+class DevHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server tuned for a browser loading many assets in parallel"""
+    daemon_threads = True
+    request_queue_size = 128
+    # On Windows SO_REUSEADDR lets a bind succeed on a port another socket is listening on,
+    # which would hide a busy port from the caller's fallback instead of raising OSError
+    allow_reuse_address = os.name != 'nt'
+    
+    def __init__(self, server_address, handler_class, reuse_port: bool = False):
+        # SO_REUSEPORT lets several worker processes bind the same port; the kernel
+        # then load-balances incoming connections across their accept() loops
+        self.reuse_port = reuse_port
+        super().__init__(server_address, handler_class)
+    
+    def server_bind(self):
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+
+class DevRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that keeps browser connections alive between asset requests"""
+    protocol_version = "HTTP/1.1"
+    # Close idle keep-alive connections so they don't pin server threads forever
+    timeout = 15
+    # Buffer writes so headers and small bodies leave in one send instead of one per header line
+    wbufsize = 64 * 1024
+    # Common web asset types resolved without consulting the mimetypes registry
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        '.html': 'text/html',
+        '.htm': 'text/html',
+        '.js': 'text/javascript',
+        '.mjs': 'text/javascript',
+        '.css': 'text/css',
+        '.json': 'application/json',
+        '.svg': 'image/svg+xml',
+        '.png': 'image/png',
+        '.jpg': 'image/jpeg',
+        '.jpeg': 'image/jpeg',
+        '.gif': 'image/gif',
+        '.ico': 'image/x-icon',
+        '.woff2': 'font/woff2',
+        '.wasm': 'application/wasm',
+    }
+    
+    # Directory listing HTML keyed on (filesystem path, request path) -> (dir mtime_ns, body)
+    _listing_cache: Dict[Tuple[str, str], Tuple[int, bytes]] = {}
+    _listing_cache_limit = 256
+    
+    logger = logging.getLogger(__name__)
+    
+    def log_message(self, format, *args):
+        """Route access logs through logging instead of unbuffered per-line stderr writes"""
+        # Lazy %-formatting: nothing is rendered when INFO is filtered out
+        self.logger.info("%s - " + format, self.address_string(), *args)
+    
+    def log_error(self, format, *args):
+        """Route handler errors through logging at warning level"""
+        self.logger.warning("%s - " + format, self.address_string(), *args)
+    
+    def translate_path(self, path: str) -> str:
+        """Map a URL path to a filesystem path, memoized across requests"""
+        return _translate_path(self.directory, path)
+    
+    def send_head(self):
+        """Send text assets gzip-compressed when the client accepts it"""
+        if ('gzip' in self.headers.get('Accept-Encoding', '')
+                and 'If-Modified-Since' not in self.headers):
+            path = self.translate_path(self.path)
+            if os.path.splitext(path)[1].lower() in _COMPRESSIBLE_EXTENSIONS:
+                try:
+                    st = os.stat(path)
+                    body = _gzip_file(path, st) if stat.S_ISREG(st.st_mode) else None
+                except OSError:
+                    body = None
+                if body is not None:
+                    self.send_response(HTTPStatus.OK)
+                    self.send_header("Content-type", self.guess_type(path))
+                    self.send_header("Content-Encoding", "gzip")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+                    self.send_header("Vary", "Accept-Encoding")
+                    self.end_headers()
+                    return io.BytesIO(body)
+        
+        # Conditional requests, binary files and misses keep the stdlib behaviour (304s, 404s, redirects)
+        return super().send_head()
+    
+    def list_directory(self, path):
+        """Serve directory listings from memory while the directory is unchanged"""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return super().list_directory(path)
+        
+        key = (path, self.path)
+        cached = self._listing_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            body = cached[1]
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-type", f"text/html; charset={sys.getfilesystemencoding()}")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            return io.BytesIO(body)
+        
+        listing = super().list_directory(path)
+        if listing is not None:
+            if len(self._listing_cache) >= self._listing_cache_limit:
+                self._listing_cache.clear()
+            self._listing_cache[key] = (mtime_ns, listing.getvalue())
+        return listing
+    
+    def copyfile(self, source, outputfile):
+        """Send files with sendfile(2) where available instead of copying through Python"""
+        if isinstance(source, io.BufferedReader) and outputfile is self.wfile:
+            # Push buffered headers out first, then let the kernel send the body.
+            # socket.sendfile falls back to plain send() on platforms without os.sendfile
+            self.wfile.flush()
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
+
+
+def is_port_available(port: int) -> bool:
+    """Check whether the port can be bound on localhost"""
+    # A plain bind: with SO_REUSEADDR Windows accepts it while another socket still listens on the port
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(('localhost', port))
+            return True
+    except OSError:
+        return False
+
+
+def wait_for_port_release(port: int, logger: logging.Logger, attempts: int = 50, interval: float = 0.01) -> bool:
+    """Poll until the port can be bound again, instead of sleeping a fixed amount"""
+    for _ in range(attempts):
+        if is_port_available(port):
+            return True
+        time.sleep(interval)
+    logger.debug(f"Port {port} still busy after cleanup")
+    return False
+
+
+def kill_port_listeners(port: int, logger: logging.Logger):
+    """Kill any existing processes listening on the port (Windows only)"""
+    if os.name != 'nt':
+        # Stale listeners are only a problem on Windows; elsewhere callers fall back to a free port
+        return
+    
+    logger.info(f"Cleaning up any existing processes on port {port}")
+    
+    if not PSUTIL_AVAILABLE:
+        # Fallback when psutil is not installed: scan the TCP table via netstat
+        os.system(f"netstat -ano | findstr :{port} > nul && (for /f \"tokens=5\" %a in ('netstat -ano ^| findstr :{port} ^| findstr LISTENING') do taskkill /f /pid %a 2>nul) || echo No processes found on port {port}")
+        wait_for_port_release(port, logger)
+        return
+    
+    try:
+        pids = {
+            conn.pid for conn in psutil.net_connections(kind='tcp')
+            if conn.pid and conn.laddr and conn.laddr.port == port
+            and conn.status == psutil.CONN_LISTEN
+        }
+    except psutil.Error as e:
+        logger.warning(f"Could not enumerate connections on port {port}: {e}")
+        return
+    pids.discard(os.getpid())
+    
+    if not pids:
+        logger.info(f"No processes found on port {port}")
+        return
+    
+    processes = []
+    for pid in pids:
+        try:
+            process = psutil.Process(pid)
+            process.terminate()
+            processes.append(process)
+        except psutil.Error as e:
+            logger.warning(f"Failed to terminate process {pid} on port {port}: {e}")
+    
+    # Wait on the terminated PIDs directly instead of sleeping, escalating to kill if needed
+    _, alive = psutil.wait_procs(processes, timeout=1)
+    for process in alive:
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+    psutil.wait_procs(alive, timeout=1)
+    logger.info(f"Terminated {len(processes)} process(es) on port {port}")
+    wait_for_port_release(port, logger)
 
 
 class ServerLauncher:
     """Handles local development server for testing changes"""
     
-    def __init__(self, serve_directory: Path, port: int = 777):
+    def __init__(self, serve_directory: Path, port: int = 777, workers: int = 1):
         self.serve_directory = serve_directory
         self.port = port
+        self.workers = workers
+        self.worker_pids = []
         self.server = None
         self.server_thread = None
         self.setup_logging()
@@ -44,31 +330,45 @@ class ServerLauncher:
             handlers=[logging.StreamHandler(sys.stdout)]
         )
     
-    def is_port_available(self) -> bool:
-        """Check if the specified port is available"""
+    def create_server(self, handler) -> DevHTTPServer:
+        """Bind the server on the preferred port, falling back to an ephemeral port if busy"""
+        reuse_port = self.workers > 1
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('localhost', self.port))
-                return True
-        except OSError:
-            return False
+            return DevHTTPServer(('localhost', self.port), handler, reuse_port=reuse_port)
+        except OSError as e:
+            self.logger.debug(f"Could not bind port {self.port}: {e}")
+        
+        # Let the OS pick a free port in the same bind instead of probing ports one by one
+        server = DevHTTPServer(('localhost', 0), handler, reuse_port=reuse_port)
+        actual_port = server.server_address[1]
+        self.logger.warning(f"Port {self.port} is busy, using port {actual_port}")
+        self.port = actual_port
+        return server
     
-    def find_available_port(self) -> int:
-        """Find an available port starting from the preferred port"""
-        for port in range(self.port, self.port + 100):
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind(('localhost', port))
-                    return port
-            except OSError:
-                continue
-        raise Exception("No available ports found")
+    def spawn_workers(self, handler):
+        """Fork additional worker processes that accept on the same port via SO_REUSEPORT"""
+        for _ in range(self.workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                # Worker process: serve on its own socket until terminated or interrupted
+                exit_code = 0
+                try:
+                    self.server.socket.close()
+                    worker_server = DevHTTPServer(('localhost', self.port), handler, reuse_port=True)
+                    worker_server.serve_forever()
+                except KeyboardInterrupt:
+                    pass
+                except Exception as e:
+                    self.logger.error(f"Worker {os.getpid()} failed: {e}")
+                    exit_code = 1
+                finally:
+                    os._exit(exit_code)
+            self.worker_pids.append(pid)
+        self.logger.info(f"Started {len(self.worker_pids)} additional worker process(es) on port {self.port}")
     
     def cleanup_port(self):
-        """Kill any existing processes on the port"""
-        self.logger.info(f"Cleaning up any existing processes on port {self.port}")
-        os.system(f"netstat -ano | findstr :{self.port} > nul && (for /f \"tokens=5\" %a in ('netstat -ano ^| findstr :{self.port} ^| findstr LISTENING') do taskkill /f /pid %a 2>nul) || echo No processes found on port {self.port}")
-        time.sleep(0.5)  # Wait for cleanup
+        """Kill any existing processes listening on the port (Windows only)"""
+        kill_port_listeners(self.port, self.logger)
     
     def start_server(self) -> str:
         """Start the local development server"""
@@ -77,40 +377,33 @@ class ServerLauncher:
             if not self.serve_directory.exists():
                 raise Exception(f"Directory does not exist: {self.serve_directory}")
             
-            # Store original directory to restore when server stops
-            self.original_cwd = os.getcwd()
-            
             # Clean up any existing processes on the port
             self.cleanup_port()
             
-            # Find available port
-            if not self.is_port_available():
-                actual_port = self.find_available_port()
-                self.logger.warning(f"Port {self.port} is busy, using port {actual_port}")
-                self.port = actual_port
-            
-            # Change to serve directory and STAY there while server runs
-            try:
-                os.chdir(self.serve_directory)
-                self.logger.info(f"Changed to serve directory: {self.serve_directory}")
-                self.logger.info(f"Current working directory: {os.getcwd()}")
-            except Exception as e:
-                self.logger.error(f"Failed to change to serve directory: {e}")
-                raise
-            
             # Create server
             try:
-                handler = SimpleHTTPRequestHandler
-                self.server = HTTPServer(('localhost', self.port), handler)
+                # Threaded server so concurrent asset requests (CSS/JS/images) don't queue
+                # behind each other on a single accept loop. The handler serves from an explicit
+                # root, so the process working directory is never changed.
+                handler = functools.partial(DevRequestHandler, directory=str(self.serve_directory.absolute()))
+                self.server = self.create_server(handler)
                 self.logger.info(f"Created HTTP server on localhost:{self.port}")
             except Exception as e:
                 self.logger.error(f"Failed to create HTTP server: {e}")
                 raise
             
-            # Start server in a separate thread
+            # Fork extra workers before this process starts any threads
+            if self.workers > 1:
+                self.spawn_workers(handler)
+            
+            # Start server in a separate thread; the socket is already bound and listening,
+            # so the thread only has to reach serve_forever before requests are accepted
+            server_ready = threading.Event()
+            
             def run_server():
                 try:
                     self.logger.info(f"Starting server thread on http://localhost:{self.port}")
+                    server_ready.set()
                     self.server.serve_forever()
                 except Exception as e:
                     self.logger.error(f"Server thread error: {e}")
@@ -118,23 +411,12 @@ class ServerLauncher:
             self.server_thread = threading.Thread(target=run_server, daemon=True)
             self.server_thread.start()
             
-            # Give server time to start and verify it's running
-            time.sleep(2)
-            
             # Verify server is actually running
-            if not self.server_thread.is_alive():
+            if not server_ready.wait(timeout=5) or not self.server_thread.is_alive():
                 raise Exception("Server thread failed to start")
             
-            # Test if server is responding
             server_url = f"http://localhost:{self.port}"
-            try:
-                import urllib.request
-                urllib.request.urlopen(server_url, timeout=5)
-                self.logger.info(f"✅ Server verified and responding at {server_url}")
-            except Exception as e:
-                self.logger.warning(f"⚠️  Server may not be responding yet: {e}")
-            
-            # DO NOT restore original directory here - keep serving from the target directory
+            self.logger.info(f"✅ Server listening at {server_url}")
             
             self.logger.info(f"🚀 Local development server started successfully!")
             self.logger.info(f"📡 Server URL: {server_url}")
@@ -145,12 +427,6 @@ class ServerLauncher:
             
         except Exception as e:
             self.logger.error(f"❌ Failed to start server: {e}")
-            # Restore original directory if there was an error
-            try:
-                if hasattr(self, 'original_cwd'):
-                    os.chdir(self.original_cwd)
-            except:
-                pass
             raise
     
     def stop_server(self):
@@ -166,103 +442,119 @@ class ServerLauncher:
         if self.server_thread and self.server_thread.is_alive():
             self.server_thread.join(timeout=5)
         
-        # Restore original directory when server stops
-        try:
-            if hasattr(self, 'original_cwd'):
-                os.chdir(self.original_cwd)
-                self.logger.info(f"Restored original directory: {self.original_cwd}")
-        except Exception as e:
-            self.logger.warning(f"Failed to restore original directory: {e}")
+        for pid in self.worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except OSError:
+                pass
+        self.worker_pids = []
     
     def run_until_interrupted(self):
         """Keep the server running until interrupted"""
-        try:
-            while True:
-                if not self.server_thread.is_alive():
-                    self.logger.error("❌ Server thread died unexpectedly")
-                    break
-                time.sleep(1)
-        except KeyboardInterrupt:
+        interrupted = threading.Event()
+        
+        def handle_interrupt(signum, frame):
             self.logger.info("\n🛑 Received shutdown signal")
+            interrupted.set()
+            # shutdown() makes serve_forever return, which unblocks the join below
             self.stop_server()
+        
+        previous_handler = signal.signal(signal.SIGINT, handle_interrupt)
+        try:
+            # Block in the kernel until the server thread exits. Windows cannot interrupt a
+            # blocking join with Ctrl+C, so wake periodically there to let the handler run.
+            join_timeout = 1 if os.name == 'nt' else None
+            while self.server_thread.is_alive():
+                self.server_thread.join(join_timeout)
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+        
+        if not interrupted.is_set():
+            self.logger.error("❌ Server thread died unexpectedly")
+
+
+def open_browser(url: str):
+    """Open the URL in the default browser as a detached process, without waiting on it"""
+    if os.name == 'nt':
+        os.startfile(url)
+    else:
+        opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+        subprocess.Popen(
+            [opener, url],
+            start_new_session=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+
+def port_number(value: str) -> int:
+    """argparse type for a TCP port number"""
+    try:
+        port = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid port number '{value}'")
+    if not (1 <= port <= 65535):
+        raise argparse.ArgumentTypeError(f"port {port} is out of valid range (1-65535)")
+    return port
 
 
 def main():
     """Entry point for the server launcher"""
-    # Check for help flag
-    if len(sys.argv) > 1 and sys.argv[1] in ['-h', '--help', 'help']:
-        print("Standalone Development Server Launcher")
-        print("=" * 40)
-        print()
-        print("This script launches a local HTTP server to test web applications.")
-        print()
-        print("Usage:")
-        print("    python launch_server.py [directory] [port]")
-        print()
-        print("Arguments:")
-        print("    directory: Directory to serve (default: ./workspace)")
-        print("    port:      Port number (default: 777)")
-        print()
-        print("Examples:")
-        print("    python launch_server.py                    # Serve ./workspace on port 777")
-        print("    python launch_server.py workspace 8080     # Serve ./workspace on port 8080")
-        print("    python launch_server.py . 3000             # Serve current directory on port 3000")
-        print()
-        print("Note: The server will automatically:")
-        print("  - Kill any existing processes on the specified port")
-        print("  - Find an alternative port if the specified one is busy")
-        print("  - Try to open your default browser")
-        print("  - Run until you press Ctrl+C")
-        return
-    
-    # Parse command line arguments
-    serve_directory = Path("./workspace")
-    port = 777
-    
-    if len(sys.argv) > 1:
-        serve_directory = Path(sys.argv[1])
-    
-    if len(sys.argv) > 2:
-        try:
-            port = int(sys.argv[2])
-        except ValueError:
-            print(f"Error: Invalid port number '{sys.argv[2]}'")
-            print("Port must be a number between 1 and 65535")
-            sys.exit(1)
+    parser = argparse.ArgumentParser(
+        prog="launch_server.py",
+        description="Standalone Development Server Launcher - launches a local HTTP server to test web applications.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""Examples:
+    python launch_server.py                    # Serve ./workspace on port 777
+    python launch_server.py workspace 8080     # Serve ./workspace on port 8080
+    python launch_server.py . 3000             # Serve current directory on port 3000
+
+Note: The server will automatically:
+  - Kill any existing processes on the specified port
+  - Find an alternative port if the specified one is busy
+  - Try to open your default browser
+  - Run until you press Ctrl+C"""
+    )
+    parser.add_argument("directory", nargs="?", type=Path, default=Path("./workspace"),
+                        help="Directory to serve (default: ./workspace)")
+    parser.add_argument("port", nargs="?", type=port_number, default=777,
+                        help="Port number (default: 777)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of server processes sharing the port via SO_REUSEPORT (default: 1, POSIX only)")
+    args = parser.parse_args()
     
-    # Validate port range
-    if not (1 <= port <= 65535):
-        print(f"Error: Port {port} is out of valid range (1-65535)")
-        sys.exit(1)
+    # Resolve once; this also validates that the directory exists
+    try:
+        serve_directory = args.directory.resolve(strict=True)
+    except OSError:
+        parser.error(f"directory '{args.directory}' does not exist")
+    if not serve_directory.is_dir():
+        parser.error(f"'{args.directory}' is not a directory")
+    port = args.port
     
-    # Validate directory
-    if not serve_directory.exists():
-        print(f"Error: Directory '{serve_directory}' does not exist")
-        print(f"Available directories:")
-        for item in Path(".").iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                print(f"  - {item}")
-        print()
-        print("Tip: Run 'python launch_server.py --help' for usage information")
-        sys.exit(1)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and not (hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT')):
+        print("Warning: --workers needs fork() and SO_REUSEPORT; running a single process")
+        args.workers = 1
     
     # Create and start server
     print(f"🚀 Starting development server...")
-    print(f"📁 Directory: {serve_directory.absolute()}")
+    print(f"📁 Directory: {serve_directory}")
     print(f"🌐 Port: {port}")
     print()
     
-    launcher = ServerLauncher(serve_directory, port)
+    launcher = ServerLauncher(serve_directory, port, workers=args.workers)
     
     try:
         server_url = launcher.start_server()
         print(f"\n🎉 Server is ready! Open your browser to: {server_url}")
-        print(f"📝 Files being served from: {serve_directory.absolute()}")
+        print(f"📝 Files being served from: {serve_directory}")
         
         # Try to open browser automatically
         try:
-            import webbrowser
-            webbrowser.open(server_url)
+            open_browser(server_url)
             print(f"🌐 Opened browser automatically")
         except:
             print(f"💡 Open your browser manually to: {server_url}")
@@ -20,23 +20,29 @@ import sys
 import json
 import logging
 import shutil
+import stat
 import tempfile
 import re
 import threading
 import time
 import socket
+import functools
+import itertools
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Iterable
 from dataclasses import dataclass
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-import base64
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from utils.md_to_jira import convert_to_jira_wiki
+from launch_server import DevHTTPServer, DevRequestHandler, is_port_available, kill_port_listeners
 
 # Third-party imports
 import google.generativeai as genai
 from jira import JIRA
-from git import Repo, InvalidGitRepositoryError
+from git import Repo, InvalidGitRepositoryError, GitCommandError
 from dotenv import load_dotenv
 import patch
 import requests # Added for the new BA agent method
@@ -47,6 +53,47 @@ try:
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Branch hints like "branch: feature/xyz" or "checkout feature/xyz", compiled once at import.
+# "use branch"/"from branch" are covered by "branch"; both alternatives are lookaheads
+# so a "checkout" match never consumes a later "branch:" hint.
+_BRANCH_RE = re.compile(
+    r'(?=branch[:\s]+(?P<branch>[a-zA-Z0-9/_-]+))|(?=checkout\s+(?P<checkout>[a-zA-Z0-9/_-]+))',
+    re.IGNORECASE
+)
+
+# Markdown code fences around AI JSON responses, in the priority the old per-pattern passes applied:
+# an opening ```json line, a closing fence line with its preceding newline, then any remaining fence
+_FENCE_RE = re.compile(
+    r'^```+\s*(?:json\s*)?\n|\n```+(?!\s*json\s*\n)\s*$|^```+\s*$|```+\s*(?:json\s*)?',
+    re.MULTILINE
+)
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+# Case-insensitive completion marker, searched in place rather than upper-casing the whole response
+_CHANGES_DONE_RE = re.compile(r'CHANGES DONE', re.IGNORECASE)
+
+# Fields each coder operation must carry, checked from one table instead of per-operation branches:
+# (path fields that must be non-empty strings, text fields that must be strings but may be empty)
+_OPERATION_FIELDS = {
+    'get_file': (('file_path',), ()),
+    'delete_file': (('file_path',), ()),
+    'copy_file': (('source_path', 'target_path'), ()),
+    'write_file': (('file_path',), ()),
+    'create_file': (('file_path',), ()),
+    'replace_lines': (('file_path',), ('new_content',)),
+    'find_and_replace': (('file_path',), ('find_regex', 'replace_text')),
+}
+
+# Coder conversation entries kept in the prompt (an assistant/system pair per turn).
+# Older turns drop off; every turn's full response is still written to temp_artifacts.
+_CODER_HISTORY_MAXLEN = 12
+
 
 @dataclass
 class JiraTicket:
@@ -171,12 +218,30 @@ class ConfigManager:
 class JiraManager:
     """Handles all Jira-related operations"""
     
+    # Issue fields needed to build a JiraTicket
+    TICKET_FIELDS = "summary,description,comment"
+    
+    # str.translate table deleting ASCII characters not allowed in attachment filenames
+    UNSAFE_FILENAME_CHARS = {
+        i: None for i in range(128) if not (chr(i).isalnum() or chr(i) in ' ._-')
+    }
+    
     def __init__(self, config: ConfigManager):
         self.config = config
         self.jira = JIRA(
             server=config.jira_server,
             basic_auth=(config.jira_username, config.jira_api_token)
         )
+        # Keep-alive session for direct REST calls so each request reuses the TLS connection.
+        # Auth and Accept are set once here instead of rebuilding the Basic header per call.
+        self.http = requests.Session()
+        self.http.auth = (config.jira_username, config.jira_api_token)
+        self.http.headers['Accept'] = 'application/json'
+        # Retry transient failures; urllib3 only retries idempotent methods, so a transition POST is never repeated
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
         self.logger = logging.getLogger(__name__)
     
     def download_ticket_attachments(self, ticket_key: str, attachments_path: Path) -> Dict[str, str]:
@@ -189,55 +254,35 @@ class JiraManager:
                 self.logger.info(f"No attachments found for ticket {ticket_key}")
                 return attachments_info
             
-            self.logger.info(f"Found {len(issue.fields.attachment)} attachment(s) for ticket {ticket_key}")
+            attachments = issue.fields.attachment
+            self.logger.info(f"Found {len(attachments)} attachment(s) for ticket {ticket_key}")
             
-            for attachment in issue.fields.attachment:
-                try:
-                    # Get attachment content
-                    attachment_content = attachment.get()
-                    
-                    # Create safe filename
-                    safe_filename = "".join(c for c in attachment.filename if c.isalnum() or c in (' ', '.', '_', '-')).rstrip()
-                    if not safe_filename:
-                        safe_filename = f"attachment_{attachment.id}"
-                    
-                    # Save to attachments directory
-                    file_path = attachments_path / safe_filename
-                    
-                    # Handle potential filename conflicts
-                    counter = 1
-                    original_path = file_path
-                    while file_path.exists():
-                        name_parts = original_path.stem, counter, original_path.suffix
-                        file_path = original_path.parent / f"{name_parts[0]}_{name_parts[1]}{name_parts[2]}"
-                        counter += 1
-                    
-                    with open(file_path, 'wb') as f:
-                        f.write(attachment_content)
-                    
-                    # Store attachment info with proper MIME type handling
-                    mime_type = getattr(attachment, 'mimeType', 'unknown')
-                    
-                    # Ensure PDF files are properly recognized
-                    if safe_filename.lower().endswith('.pdf') and mime_type == 'unknown':
-                        mime_type = 'application/pdf'
-                    
-                    attachments_info[str(file_path.name)] = {
-                        'original_filename': attachment.filename,
-                        'size': attachment.size,
-                        'content_type': mime_type,  # Use content_type consistently
-                        'mimetype': mime_type,      # Keep mimetype for backward compatibility
-                        'created': str(attachment.created),
-                        'author': str(attachment.author),
-                        'local_path': str(file_path),
-                        'is_pdf': mime_type == 'application/pdf' or safe_filename.lower().endswith('.pdf')
-                    }
-                    
-                    self.logger.info(f"Downloaded attachment: {attachment.filename} -> {file_path.name}")
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to download attachment {attachment.filename}: {e}")
-                    continue
+            # Pick every local filename up front (in ticket order) so naming is deterministic,
+            # then fetch concurrently since each download is an independent HTTPS round-trip
+            # Names already on disk are listed once so conflicts are resolved in memory.
+            # They are compared casefolded, since Windows and macOS filesystems ignore case
+            try:
+                with os.scandir(attachments_path) as it:
+                    reserved_names = {entry.name.casefold() for entry in it}
+            except FileNotFoundError:
+                reserved_names = set()
+            targets = []
+            for attachment in attachments:
+                file_path = self._attachment_target_path(attachment, attachments_path, reserved_names)
+                reserved_names.add(file_path.name.casefold())
+                targets.append((attachment, file_path))
+            
+            with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+                futures = [
+                    executor.submit(self._download_attachment, attachment, file_path)
+                    for attachment, file_path in targets
+                ]
+                # Collect in submission order so attachment listings stay deterministic
+                for future in futures:
+                    result = future.result()
+                    if result:
+                        filename, info = result
+                        attachments_info[filename] = info
             
             return attachments_info
             
@@ -245,11 +290,81 @@ class JiraManager:
             self.logger.error(f"Failed to download attachments for ticket {ticket_key}: {e}")
             return {}
     
+    def _attachment_target_path(self, attachment, attachments_path: Path, reserved_names: set) -> Path:
+        """Build a safe local path for an attachment that doesn't clash with the casefolded reserved_names"""
+        # Create safe filename
+        safe_filename = attachment.filename.translate(self.UNSAFE_FILENAME_CHARS)
+        if not safe_filename.isascii():
+            # Non-ASCII letters and digits are kept, anything else is dropped
+            safe_filename = "".join(c for c in safe_filename if c.isascii() or c.isalnum())
+        safe_filename = safe_filename.rstrip()
+        if not safe_filename:
+            safe_filename = f"attachment_{attachment.id}"
+        
+        # Save to attachments directory
+        file_path = attachments_path / safe_filename
+        
+        # Handle potential filename conflicts
+        counter = 1
+        original_path = file_path
+        while file_path.name.casefold() in reserved_names:
+            name_parts = original_path.stem, counter, original_path.suffix
+            file_path = original_path.parent / f"{name_parts[0]}_{name_parts[1]}{name_parts[2]}"
+            counter += 1
+        
+        return file_path
+    
+    def _download_attachment(self, attachment, file_path: Path) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Download a single attachment to file_path and return (local filename, attachment info)"""
+        try:
+            # Stream the content straight to disk through the authenticated REST session,
+            # so memory stays bounded at one chunk regardless of attachment size
+            with self.http.get(attachment.content, headers={"Accept": "*/*"}, stream=True) as response:
+                response.raise_for_status()
+                # 1 MiB buffer: coalesce downloaded chunks into few large write() syscalls
+                with open(file_path, 'wb', buffering=1 << 20) as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+            
+            # Read metadata straight from the JSON Jira returned instead of the resource attributes
+            raw = attachment.raw or {}
+            
+            # Store attachment info with proper MIME type handling
+            mime_type = raw.get('mimeType', 'unknown')
+            
+            # Ensure PDF files are properly recognized
+            if file_path.name.lower().endswith('.pdf') and mime_type == 'unknown':
+                mime_type = 'application/pdf'
+            
+            info = {
+                'original_filename': attachment.filename,
+                'size': raw.get('size'),
+                'content_type': mime_type,  # Use content_type consistently
+                'mimetype': mime_type,      # Keep mimetype for backward compatibility
+                'created': str(raw.get('created')),
+                'author': (raw.get('author') or {}).get('displayName', ''),
+                'local_path': str(file_path),
+                'is_pdf': mime_type == 'application/pdf' or file_path.name.lower().endswith('.pdf')
+            }
+            
+            self.logger.info(f"Downloaded attachment: {attachment.filename} -> {file_path.name}")
+            return str(file_path.name), info
+            
+        except Exception as e:
+            self.logger.error(f"Failed to download attachment {attachment.filename}: {e}")
+            # Don't leave a partially streamed file behind
+            try:
+                file_path.unlink()
+            except OSError:
+                pass
+            return None
+    
     def get_oldest_open_ticket(self) -> Optional[JiraTicket]:
         """Fetch the oldest open/reopened ticket from the specified project"""
         try:
             jql = f'project = {self.config.jira_project_key} AND status IN ("Open", "Reopened") ORDER BY created ASC'
-            issues = self.jira.search_issues(jql, maxResults=1)
+            # Only request the fields we read; the default '*all' pulls every field and changelog-sized payloads
+            issues = self.jira.search_issues(jql, maxResults=1, fields=self.TICKET_FIELDS)
             
             if not issues:
                 self.logger.info("No open tickets found")
@@ -281,25 +396,21 @@ class JiraManager:
     
     def _extract_branch_from_ticket(self, description: str, comments: List[str]) -> Optional[str]:
         """Extract branch name from ticket description or comments"""
-        # Look for patterns like "branch: feature/xyz" or "use branch feature/xyz"
-        branch_patterns = [
-            r'branch[:\s]+([a-zA-Z0-9/_-]+)',
-            r'use\s+branch[:\s]+([a-zA-Z0-9/_-]+)',
-            r'from\s+branch[:\s]+([a-zA-Z0-9/_-]+)',
-            r'checkout\s+([a-zA-Z0-9/_-]+)',
-        ]
-        
-        all_text = description + " " + " ".join(comments)
-        
-        for pattern in branch_patterns:
-            match = re.search(pattern, all_text, re.IGNORECASE)
-            if match:
-                branch_name = match.group(1)
-                # Validate branch name format
-                if re.match(r'^[a-zA-Z0-9/_-]+$', branch_name):
-                    return branch_name
+        # "branch" hints take priority over "checkout" hints anywhere in the ticket.
+        # Texts are scanned one at a time so the thread is never concatenated.
+        checkout_name = None
+        for text in (description, *comments):
+            for match in _BRANCH_RE.finditer(text):
+                name = match.group('branch') or match.group('checkout')
+                # IGNORECASE lets [a-zA-Z] also match a few non-ASCII letters ('ſ', 'İ', the Kelvin sign)
+                if not name.isascii():
+                    continue
+                if match.group('branch'):
+                    return name
+                if checkout_name is None:
+                    checkout_name = name
         
-        return None
+        return checkout_name
     
     def add_comment(self, ticket_key: str, comment: str):
         """Add a comment to the specified Jira ticket"""
@@ -313,40 +424,14 @@ class JiraManager:
     def transition_ticket(self, ticket_key: str, status: str):
         """Transition ticket to the specified status using Jira REST API"""
         try:
-            # First, get available transitions for the issue
-            transitions_url = f"{self.config.jira_server}/rest/api/3/issue/{ticket_key}/transitions"
-            headers = {
-                'Accept': 'application/json',
-                'Authorization': f'Basic {base64.b64encode(f"{self.config.jira_username}:{self.config.jira_api_token}".encode()).decode()}'
-            }
-            
-            response = requests.get(transitions_url, headers=headers)
-            response.raise_for_status()
-            
-            transitions_data = response.json()
-            transition_id = None
-            
-            # Find the transition that matches the target status
-            for transition in transitions_data.get('transitions', []):
-                if transition.get('to', {}).get('name', '').lower() == status.lower():
-                    transition_id = transition.get('id')
-                    break
+            transition_url = f"{self.config.jira_server}/rest/api/3/issue/{ticket_key}/transitions"
             
+            transition_id = self._find_transition_id(ticket_key, status, transition_url)
             if not transition_id:
-                # Log available transitions for debugging
-                available_transitions = [t.get('to', {}).get('name', 'Unknown') for t in transitions_data.get('transitions', [])]
-                self.logger.warning(f"Status '{status}' not available for ticket {ticket_key}. Available transitions: {available_transitions}")
                 return
             
             # Perform the transition
-            transition_url = f"{self.config.jira_server}/rest/api/3/issue/{ticket_key}/transitions"
-            transition_data = {
-                "transition": {
-                    "id": transition_id
-                }
-            }
-            
-            response = requests.post(transition_url, headers=headers, json=transition_data)
+            response = self.http.post(transition_url, json={"transition": {"id": transition_id}})
             response.raise_for_status()
             
             self.logger.info(f"Successfully transitioned ticket {ticket_key} to {status}")
@@ -359,11 +444,44 @@ class JiraManager:
         except Exception as e:
             self.logger.error(f"Failed to transition ticket {ticket_key} to {status}: {e}")
             raise
+    
+    def _find_transition_id(self, ticket_key: str, status: str, transition_url: str) -> Optional[str]:
+        """Look up the id of the transition leading to status among the ticket's available transitions"""
+        response = self.http.get(transition_url)
+        response.raise_for_status()
+        
+        transitions_data = response.json()
+        
+        # Find the transition that matches the target status
+        for transition in transitions_data.get('transitions', []):
+            if transition.get('to', {}).get('name', '').lower() == status.lower():
+                return transition.get('id')
+        
+        # Log available transitions for debugging
+        available_transitions = [t.get('to', {}).get('name', 'Unknown') for t in transitions_data.get('transitions', [])]
+        self.logger.warning(f"Status '{status}' not available for ticket {ticket_key}. Available transitions: {available_transitions}")
+        return None
 
 
 class GitManager:
     """Handles all Git-related operations"""
     
+    # Text file extensions included in the codebase context.
+    # .env is left out on purpose: environment files hold secrets and must never reach the AI prompt
+    TEXT_EXTENSIONS = frozenset({
+        '.py', '.js', '.html', '.htm', '.css', '.json', '.md', '.txt',
+        '.yml', '.yaml', '.xml', '.sql', '.sh', '.bat'
+    })
+    
+    # Directory/file names never included in the codebase context
+    EXCLUDED_NAMES = frozenset({
+        '.git', '__pycache__', '.pytest_cache', 'node_modules',
+        '.vscode', '.idea', 'venv', 'env', '.env'
+    })
+    
+    # Only the branch tips are needed; --no-single-branch keeps every remote branch visible for checkout
+    SHALLOW_CLONE_OPTIONS = ['--depth=1', '--no-single-branch', '--filter=blob:none']
+    
     def __init__(self, config: ConfigManager):
         self.config = config
         self.workspace_path = Path(config.git_workspace_path)
@@ -389,15 +507,14 @@ class GitManager:
                             # First try to fetch updates
                             self.repo.git.fetch()
                             
-                            # Check if branch exists locally
-                            local_branches = [ref.name.split('/')[-1] for ref in self.repo.refs if ref.name.startswith('refs/heads/')]
-                            remote_branches = [ref.name.split('/')[-1] for ref in self.repo.refs if ref.name.startswith('refs/remotes/origin/')]
+                            # Check if branch exists locally or on the remote
+                            local_branches, remote_branches = self._list_branches()
                             
                             if specified_branch in local_branches:
                                 # Branch exists locally
                                 self.repo.git.checkout(specified_branch)
                                 if specified_branch in remote_branches:
-                                    self.repo.git.pull('origin', specified_branch)
+                                    self._refresh_branch(specified_branch)
                                 self.logger.info(f"Checked out existing local branch: {specified_branch}")
                             elif specified_branch in remote_branches:
                                 # Branch exists on remote but not locally
@@ -407,26 +524,26 @@ class GitManager:
                                 # Branch doesn't exist, fallback to main
                                 self.logger.info(f"Branch {specified_branch} doesn't exist, falling back to main")
                                 self.repo.git.checkout('main')
-                                self.repo.git.pull()
+                                self._refresh_branch('main')
                         except Exception as e:
                             self.logger.warning(f"Failed to checkout {specified_branch}, falling back to main: {e}")
                             try:
                                 self.repo.git.checkout('main')
-                                self.repo.git.pull()
+                                self._refresh_branch('main')
                             except Exception as e2:
                                 self.logger.warning(f"Failed to checkout main, trying master: {e2}")
                                 self.repo.git.checkout('master')
-                                self.repo.git.pull()
+                                self._refresh_branch('master')
                     else:
                         # No specific branch requested, use main
                         try:
                             self.repo.git.checkout('main')
-                            self.repo.git.pull()
+                            self._refresh_branch('main')
                             self.logger.info("Checked out and updated main branch")
                         except Exception as e:
                             self.logger.warning(f"Failed to checkout main, trying master: {e}")
                             self.repo.git.checkout('master')
-                            self.repo.git.pull()
+                            self._refresh_branch('master')
                             self.logger.info("Checked out and updated master branch")
                     
                 except InvalidGitRepositoryError:
@@ -440,6 +557,37 @@ class GitManager:
             self.logger.error(f"Failed to prepare workspace: {e}")
             raise
     
+    def _refresh_branch(self, branch: str):
+        """Move the checked-out branch to the origin tip without deepening the shallow history"""
+        self.repo.git.fetch('--depth=1', '--filter=blob:none', 'origin', branch)
+        self.repo.git.reset('--hard', f'origin/{branch}')
+    
+    def _list_branches(self) -> Tuple[set, set]:
+        """Return (local, origin) branch names from a single for-each-ref call"""
+        output = self.repo.git.for_each_ref('--format=%(refname)', 'refs/heads/', 'refs/remotes/origin/')
+        local_branches, remote_branches = set(), set()
+        for refname in output.splitlines():
+            if refname.startswith('refs/heads/'):
+                local_branches.add(refname[len('refs/heads/'):])
+            elif refname.startswith('refs/remotes/origin/'):
+                remote_branches.add(refname[len('refs/remotes/origin/'):])
+        return local_branches, remote_branches
+    
+    def _clone_from_remote(self, **kwargs) -> Repo:
+        """Shallow, blob-less clone of the remote, falling back to a full clone if the remote refuses it"""
+        try:
+            return Repo.clone_from(
+                self.config.git_repo_url,
+                str(self.workspace_path),
+                multi_options=self.SHALLOW_CLONE_OPTIONS,
+                **kwargs
+            )
+        except GitCommandError as e:
+            self.logger.warning(f"Shallow clone failed, retrying with full history: {e}")
+            if self.workspace_path.exists():
+                shutil.rmtree(self.workspace_path)
+            return Repo.clone_from(self.config.git_repo_url, str(self.workspace_path), **kwargs)
+    
     def _clone_repository(self, specified_branch: Optional[str] = None):
         """Clone the repository to workspace"""
         try:
@@ -448,16 +596,12 @@ class GitManager:
             # Always clone main/master first to ensure we have a working base
             try:
                 # Try main first
-                self.repo = Repo.clone_from(self.config.git_repo_url, str(self.workspace_path))
+                self.repo = self._clone_from_remote()
                 self.logger.info(f"Cloned repository (main branch) to {self.workspace_path}")
             except Exception as e:
                 # Try master as fallback
                 try:
-                    self.repo = Repo.clone_from(
-                        self.config.git_repo_url, 
-                        str(self.workspace_path),
-                        branch='master'
-                    )
+                    self.repo = self._clone_from_remote(branch='master')
                     self.logger.info(f"Cloned repository (master branch) to {self.workspace_path}")
                 except Exception as e2:
                     self.logger.error(f"Failed to clone from both main and master: {e}, {e2}")
@@ -466,18 +610,9 @@ class GitManager:
             # If a specific branch was requested, try to switch to it
             if specified_branch and specified_branch not in ['main', 'master']:
                 try:
-                    # First fetch all remote branches
-                    self.repo.git.fetch()
-                    
-                    # Check if branch exists on remote using reliable Git command
-                    try:
-                        # Use git ls-remote to check if branch exists on remote
-                        result = self.repo.git.ls_remote('--heads', 'origin', specified_branch)
-                        branch_exists_on_remote = bool(result.strip())
-                    except:
-                        # Fallback to checking local remote refs
-                        remote_branches = [ref.name.split('/')[-1] for ref in self.repo.refs if ref.name.startswith('refs/remotes/origin/')]
-                        branch_exists_on_remote = specified_branch in remote_branches
+                    # The fresh clone already has every remote branch, so no extra fetch is needed
+                    _, remote_branches = self._list_branches()
+                    branch_exists_on_remote = specified_branch in remote_branches
                     
                     if branch_exists_on_remote:
                         # Branch exists on remote, check it out
@@ -490,12 +625,12 @@ class GitManager:
                             if "already exists" in str(checkout_error):
                                 self.logger.info(f"Branch {specified_branch} already exists locally, switching to it")
                                 self.repo.git.checkout(specified_branch)
-                                # Pull latest changes to ensure it's up to date
+                                # Update to the latest remote tip
                                 try:
-                                    self.repo.git.pull('origin', specified_branch)
-                                    self.logger.info(f"Pulled latest changes for existing branch {specified_branch}")
+                                    self._refresh_branch(specified_branch)
+                                    self.logger.info(f"Updated existing branch {specified_branch}")
                                 except Exception as pull_error:
-                                    self.logger.warning(f"Could not pull from remote branch {specified_branch}: {pull_error}")
+                                    self.logger.warning(f"Could not update from remote branch {specified_branch}: {pull_error}")
                             else:
                                 raise checkout_error
                     else:
@@ -520,33 +655,25 @@ class GitManager:
                 return branch_name
             
             # Check if the branch already exists locally
-            existing_branches = [ref.name.split('/')[-1] for ref in self.repo.refs if ref.name.startswith('refs/heads/')]
+            existing_branches, _ = self._list_branches()
             
             if branch_name in existing_branches:
                 # Branch exists locally, switch to it
                 self.logger.info(f"Branch {branch_name} already exists locally, switching to it")
                 self.repo.git.checkout(branch_name)
-                # Pull latest changes from remote if the branch exists there too
+                # Update to the remote tip if the branch exists there too
                 try:
-                    self.repo.git.pull('origin', branch_name)
-                    self.logger.info(f"Pulled latest changes for existing branch {branch_name}")
+                    self._refresh_branch(branch_name)
+                    self.logger.info(f"Updated existing branch {branch_name}")
                 except Exception as e:
-                    self.logger.warning(f"Could not pull from remote branch {branch_name}: {e}")
+                    self.logger.warning(f"Could not update from remote branch {branch_name}: {e}")
             else:
                 # Check if branch exists on remote
                 try:
-                    # Fetch latest remote info
+                    # Fetch latest remote info, after which the remote-tracking refs are current
                     self.repo.git.fetch()
-                    
-                    # Check if branch exists on remote using reliable Git command
-                    try:
-                        # Use git ls-remote to check if branch exists on remote
-                        result = self.repo.git.ls_remote('--heads', 'origin', branch_name)
-                        branch_exists_on_remote = bool(result.strip())
-                    except:
-                        # Fallback to checking local remote refs
-                        remote_branches = [ref.name.split('/')[-1] for ref in self.repo.refs if ref.name.startswith('refs/remotes/origin/')]
-                        branch_exists_on_remote = branch_name in remote_branches
+                    _, remote_branches = self._list_branches()
+                    branch_exists_on_remote = branch_name in remote_branches
                     
                     if branch_exists_on_remote:
                         # Branch exists on remote, check it out
@@ -559,12 +686,12 @@ class GitManager:
                             if "already exists" in str(checkout_error):
                                 self.logger.info(f"Branch {branch_name} already exists locally, switching to it")
                                 self.repo.git.checkout(branch_name)
-                                # Pull latest changes to ensure it's up to date
+                                # Update to the latest remote tip
                                 try:
-                                    self.repo.git.pull('origin', branch_name)
-                                    self.logger.info(f"Pulled latest changes for existing branch {branch_name}")
+                                    self._refresh_branch(branch_name)
+                                    self.logger.info(f"Updated existing branch {branch_name}")
                                 except Exception as pull_error:
-                                    self.logger.warning(f"Could not pull from remote branch {branch_name}: {pull_error}")
+                                    self.logger.warning(f"Could not update from remote branch {branch_name}: {pull_error}")
                             else:
                                 raise checkout_error
                     else:
@@ -574,7 +701,7 @@ class GitManager:
                         if current_branch != 'main':
                             try:
                                 self.repo.git.checkout('main')
-                                self.repo.git.pull()
+                                self._refresh_branch('main')
                             except:
                                 pass  # Continue if we can't switch to main
                         self.repo.git.checkout('-b', branch_name)
@@ -593,41 +720,17 @@ class GitManager:
     
     def get_codebase_structure(self) -> str:
         """Get a formatted string representation of the codebase structure"""
-        structure_lines = []
-        
-        # Define directories/files to exclude
-        exclude_patterns = {
-            '.git', '__pycache__', '.pytest_cache', 'node_modules', 
-            '.vscode', '.idea', 'venv', 'env', '.env'
-        }
-        
         try:
-            # Get all files and directories
-            all_items = list(self.workspace_path.rglob('*'))
-            
-            # Sort items for consistent output
-            all_items.sort(key=lambda x: str(x))
-            
-            for item_path in all_items:
-                # Skip if in excluded patterns
-                if any(pattern in str(item_path) for pattern in exclude_patterns):
-                    continue
-                
-                # Calculate relative path and depth
-                relative_path = item_path.relative_to(self.workspace_path)
-                depth = len(relative_path.parts)
-                
-                # Create indentation based on depth
-                indent = "  " * (depth - 1) if depth > 1 else ""
-                
-                # Add appropriate symbol
-                if item_path.is_dir():
-                    structure_lines.append(f"{indent}📁 {relative_path.name}/")
-                else:
-                    structure_lines.append(f"{indent}📄 {relative_path.name}")
+            # Excluded directories are pruned during the walk instead of filtered afterwards.
+            # Indentation follows depth; directories are marked by their trailing slash alone, since
+            # icon glyphs cost extra prompt tokens on every line without adding information.
+            structure = "\n".join(
+                f"{'  ' * relative_path.count(os.sep)}{entry.name}{'/' if entry.is_dir(follow_symlinks=False) else ''}"
+                for relative_path, entry in self._walk_workspace()
+            )
             
-            if structure_lines:
-                return "Project Structure:\n" + "\n".join(structure_lines)
+            if structure:
+                return "Project Structure:\n" + structure
             else:
                 return "Project Structure: No files found"
                 
@@ -635,70 +738,116 @@ class GitManager:
             self.logger.error(f"Failed to get codebase structure: {e}")
             return "Project Structure: Error reading structure"
     
-    def get_all_file_contents(self) -> Dict[str, str]:
-        """Read all text files in the workspace and return as dict"""
-        file_contents = {}
-        
-        # Define text file extensions to include
-        text_extensions = {
-            '.py', '.js', '.html', '.htm', '.css', '.json', '.md', '.txt', 
-            '.yml', '.yaml', '.xml', '.sql', '.sh', '.bat', '.env'
-        }
-        
-        # Define directories/files to exclude
-        exclude_patterns = {
-            '.git', '__pycache__', '.pytest_cache', 'node_modules', 
-            '.vscode', '.idea', 'venv', 'env', '.env'
-        }
-        
+    def _walk_workspace(self, dir_path: Optional[str] = None, relative_dir: str = ''):
+        """Yield (relative path, DirEntry) for workspace entries in sorted pre-order, never descending into excluded directories"""
+        dir_path = dir_path or str(self.workspace_path)
         try:
-            for file_path in self.workspace_path.rglob('*'):
-                # Skip if it's a directory
-                if file_path.is_dir():
-                    continue
-                
-                # Skip if in excluded patterns
-                if any(pattern in str(file_path) for pattern in exclude_patterns):
-                    continue
-                
-                # Skip if not a text file
-                if file_path.suffix.lower() not in text_extensions:
-                    continue
-                
-                # Skip if file is too large (>1MB)
-                if file_path.stat().st_size > 1024 * 1024:
-                    continue
-                
-                try:
-                    relative_path = file_path.relative_to(self.workspace_path)
-                    with open(file_path, 'r', encoding='utf-8-sig', errors='ignore') as f:
-                        file_contents[str(relative_path)] = f.read()
-                except Exception as e:
-                    self.logger.warning(f"Failed to read file {file_path}: {e}")
-                    continue
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            self.logger.warning(f"Failed to list directory {dir_path}: {e}")
+            return
+        
+        for entry in entries:
+            if entry.name in self.EXCLUDED_NAMES:
+                continue
+            relative_path = os.path.join(relative_dir, entry.name) if relative_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                yield relative_path, entry
+                yield from self._walk_workspace(entry.path, relative_path)
+            elif entry.is_file():
+                yield relative_path, entry
+    
+    def _iter_workspace_files(self):
+        """Yield (relative path, DirEntry) for workspace files"""
+        for relative_path, entry in self._walk_workspace():
+            if not entry.is_dir(follow_symlinks=False):
+                yield relative_path, entry
+    
+    def iter_file_contents(self) -> Iterator[Tuple[str, str]]:
+        """Yield (relative path, content) for each workspace text file in walk order"""
+        candidates = []
+        for relative_path, entry in self._iter_workspace_files():
+            # Skip if not a text file (a leading dot marks a dotfile, not an extension)
+            name = entry.name
+            dot = name.rfind('.')
+            if dot <= 0 or name[dot:].lower() not in self.TEXT_EXTENSIONS:
+                continue
+            
+            # Skip environment files such as .env.json, whose extension alone looks harmless
+            if name[:4].lower() == '.env':
+                continue
             
-            self.logger.info(f"Read {len(file_contents)} files from workspace")
-            return file_contents
+            # Skip if file is too large (>1MB)
+            try:
+                stat_result = entry.stat()
+            except OSError as e:
+                # The file was removed or replaced while the workspace was being walked
+                self.logger.warning(f"Failed to stat file {entry.path}: {e}")
+                continue
+            if stat_result.st_size > 1024 * 1024:
+                continue
             
+            candidates.append((relative_path, entry.path))
+        
+        # Read files in parallel, the GIL is released during open/read.
+        # map() yields in submission order, so each file is handed on as soon as it's read.
+        files_read = 0
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4, len(candidates) or 1)) as executor:
+            contents = executor.map(self._read_text_file, [path for _, path in candidates])
+            for (relative_path, _), content in zip(candidates, contents):
+                if content is not None:
+                    files_read += 1
+                    yield relative_path, content
+        self.logger.info(f"Read {files_read} files from workspace")
+    
+    def _read_text_file(self, path: str) -> Optional[str]:
+        """Read a single workspace text file, returning None if it can't be read"""
+        try:
+            # Unbuffered binary read: one sized read per file, without building a text wrapper and decoder.
+            # Files are capped at 1MB by the caller, so mmap would not save anything here.
+            with open(path, 'rb', buffering=0) as f:
+                data = f.readall()
         except Exception as e:
-            self.logger.error(f"Failed to read workspace files: {e}")
-            return {}
+            self.logger.warning(f"Failed to read file {path}: {e}")
+            return None
+        
+        text = data.decode('utf-8-sig', errors='ignore')
+        # Match text-mode reads, which translate \r\n and lone \r to \n
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+    
+    def _content_matches(self, target_path: Path, data: bytes) -> bool:
+        """Check whether target_path already holds exactly data, comparing sizes before reading"""
+        try:
+            if target_path.stat().st_size != len(data):
+                return False
+            with open(target_path, 'rb') as f:
+                return f.read() == data
+        except OSError:
+            return False
     
     def create_file(self, file_path: str, content: str) -> bool:
         """Create a new file with the specified content"""
         try:
             target_path = self.workspace_path / file_path
             
+            data = content.encode('utf-8')
+            
             # Check if file already exists
             if target_path.exists():
+                if self._content_matches(target_path, data):
+                    self.logger.info(f"File unchanged, skipping write: {file_path}")
+                    return True
                 self.logger.warning(f"File already exists, will overwrite: {file_path}")
             
             # Create directory if it doesn't exist
             target_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Write the content
-            with open(target_path, 'w', encoding='utf-8', newline='') as f:
-                f.write(content)
+            with open(target_path, 'wb', buffering=1 << 18) as f:
+                f.write(data)
             
             self.logger.info(f"Successfully created file: {file_path}")
             return True
@@ -729,8 +878,10 @@ class GitManager:
             # Create target directory if it doesn't exist
             target_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Copy the file
-            shutil.copy2(source_file, target_file)
+            # Copy the contents only; copyfile uses the OS fast path (sendfile/CopyFile) and, unlike copy2,
+            # skips copying metadata. Attachments are plain downloaded files, so their timestamps and
+            # default permissions carry nothing worth keeping
+            shutil.copyfile(source_file, target_file)
             
             self.logger.info(f"Successfully copied file: {source_path} -> {target_path}")
             return True
@@ -763,13 +914,19 @@ class GitManager:
         """Write complete file content to the specified path"""
         try:
             target_path = self.workspace_path / file_path
+            data = content.encode('utf-8')
+            
+            # Skip identical rewrites so the file's mtime only moves on real changes
+            if self._content_matches(target_path, data):
+                self.logger.info(f"File unchanged, skipping write: {file_path}")
+                return True
             
             # Create directory if it doesn't exist
             target_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Write the content
-            with open(target_path, 'w', encoding='utf-8', newline='') as f:
-                f.write(content)
+            with open(target_path, 'wb', buffering=1 << 18) as f:
+                f.write(data)
             
             self.logger.info(f"Successfully wrote file: {file_path}")
             return True
@@ -890,7 +1047,7 @@ class GitManager:
                     return False, f"HTML validation failed: Orphaned closing tags found: {orphaned_tags}. This would create invalid HTML structure."
             
             # Write back to file
-            with open(target_path, 'w', encoding='utf-8', newline='') as f:
+            with open(target_path, 'w', encoding='utf-8', newline='', buffering=1 << 18) as f:
                 f.writelines(updated_lines)
             
             # Return success and the updated content
@@ -916,19 +1073,14 @@ class GitManager:
                 self.logger.error(f"Failed to create file {file_path}: {e}")
                 return False
         
-        original_content = ""
         try:
-            # Step 1: Read original content and normalize its line endings in memory
-            with open(full_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                original_content = f.read()
-            
-            normalized_original_content = original_content.replace('\r\n', '\n')
-            
-            # Step 2: Normalize patch content line endings
-            patch_content = patch_content.replace('\r\n', '\n')
+            # Step 1: Encode once and normalize line endings on the bytes
+            patch_bytes = patch_content.encode('utf-8')
+            if b'\r' in patch_bytes:
+                patch_bytes = patch_bytes.replace(b'\r\n', b'\n')
 
-            # Step 3: Use patch.fromstring and apply relative to the workspace root
-            patch_set = patch.fromstring(patch_content.encode('utf-8'))
+            # Step 2: Use patch.fromstring and apply relative to the workspace root
+            patch_set = patch.fromstring(patch_bytes)
             
             # This is the key: `root=self.workspace_path` tells the patch tool where to find `a/footer.htm`, etc.
             if patch_set.apply(root=self.workspace_path):
@@ -936,7 +1088,16 @@ class GitManager:
                 return True
             else:
                 self.logger.warning(f"Failed to apply patch to {file_path}. Checking if already applied.")
-                if self._check_if_patch_already_applied(patch_content, normalized_original_content):
+                
+                # The file is only needed for this check, so read it here in a single binary pass
+                # and only copy it when there are CRLF line endings to normalize
+                with open(full_file_path, 'rb') as f:
+                    raw_content = f.read()
+                if b'\r' in raw_content:
+                    raw_content = raw_content.replace(b'\r\n', b'\n')
+                current_content = raw_content.decode('utf-8', errors='ignore')
+                
+                if self._check_if_patch_already_applied(patch_bytes.decode('utf-8'), current_content):
                      self.logger.info(f"Changes for {file_path} appear to be already applied. Skipping.")
                      return False
                 else:
@@ -950,34 +1111,41 @@ class GitManager:
     def _check_if_patch_already_applied(self, patch_content: str, current_content: str) -> bool:
         """More robust check to see if patch changes might already be applied or are not needed."""
         try:
-            added_lines = []
-            removed_lines = []
+            added_lines = set()
+            removed_lines = set()
+            
+            # Blank lines say nothing about whether the change is present, so they are ignored
+            for line in patch_content.splitlines():
+                # Context lines are the common case, so skip them before any other work
+                marker = line[:1]
+                if marker != '+' and marker != '-':
+                    continue
+                if line.startswith(('+++', '---')):
+                    continue
+                stripped = line[1:].strip()
+                if stripped:
+                    (added_lines if marker == '+' else removed_lines).add(stripped)
+            
+            if not added_lines and not removed_lines:
+                return False
             
-            for line in patch_content.split('\n'):
-                if line.startswith('+') and not line.startswith('+++'):
-                    added_lines.append(line[1:].strip())
-                elif line.startswith('-') and not line.startswith('---'):
-                    removed_lines.append(line[1:].strip())
+            # Hash the file's lines once so each patch line is an O(1) lookup instead of a full-text scan
+            current_lines = {line.strip() for line in current_content.splitlines()}
 
             # Scenario 1: The patch is trying to ADD lines.
             if added_lines and not removed_lines:
                 # If all added lines are already present, the patch is applied.
-                return all(line in current_content for line in added_lines)
+                return added_lines.issubset(current_lines)
             
             # Scenario 2: The patch is trying to REMOVE lines (a revert).
             if removed_lines and not added_lines:
                 # If none of the lines to be removed are present, the revert is already complete.
-                return not any(line in current_content for line in removed_lines)
+                return removed_lines.isdisjoint(current_lines)
                 
             # Scenario 3: The patch is MODIFYING lines (both adds and removes).
-            if added_lines and removed_lines:
-                # A simple heuristic: if all the additions are present AND none of the removals are,
-                # it's highly likely the change has been applied.
-                adds_present = all(line in current_content for line in added_lines)
-                removals_absent = not any(line in current_content for line in removed_lines)
-                return adds_present and removals_absent
-
-            return False
+            # A simple heuristic: if all the additions are present AND none of the removals are,
+            # it's highly likely the change has been applied.
+            return added_lines.issubset(current_lines) and removed_lines.isdisjoint(current_lines)
         except Exception as e:
             self.logger.warning(f"Could not determine if patch was already applied: {e}")
             return False
@@ -1070,7 +1238,7 @@ class GitManager:
             new_content = pattern.sub(replace_text, current_content)
             
             # Write back to file
-            with open(full_path, 'w', encoding='utf-8', newline='') as f:
+            with open(full_path, 'w', encoding='utf-8', newline='', buffering=1 << 18) as f:
                 f.write(new_content)
             
             self.logger.info(f"Successfully replaced text in {file_path} using regex")
@@ -1091,12 +1259,20 @@ class InstructionManager:
         self.instructions_path = Path("instructions")
         self.logger = logging.getLogger(__name__)
     
+    def _read_instructions(self, file_path: Path) -> Optional[str]:
+        """Read an instruction file, returning None if it is missing"""
+        # Opening directly saves the separate exists() check
+        try:
+            return file_path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            return None
+    
     def load_ba_instructions(self) -> str:
         """Load BA agent instructions"""
         try:
-            ba_file = self.instructions_path / "ba.md"
-            if ba_file.exists():
-                return ba_file.read_text(encoding='utf-8')
+            content = self._read_instructions(self.instructions_path / "ba.md")
+            if content is not None:
+                return content
             else:
                 self.logger.warning("BA instructions file not found")
                 return ""
@@ -1107,9 +1283,9 @@ class InstructionManager:
     def load_coder_instructions(self) -> str:
         """Load Coder agent instructions"""
         try:
-            coder_file = self.instructions_path / "coder.md"
-            if coder_file.exists():
-                return coder_file.read_text(encoding='utf-8')
+            content = self._read_instructions(self.instructions_path / "coder.md")
+            if content is not None:
+                return content
             else:
                 self.logger.warning("Coder instructions file not found")
                 return ""
@@ -1138,7 +1314,14 @@ class AIAgent:
         # Initialize Gemini client if needed
         if self.ba_provider == 'gemini' or self.coding_provider == 'gemini':
             genai.configure(api_key=config.gemini_api_key)
-            # We'll create model instances as needed since they might use different models
+        
+        # Gemini model instances keyed on model name, created on first use since BA and Coding may differ.
+        # This only saves rebuilding the model object each turn; the SDK client is already shared process-wide.
+        self._gemini_models: Dict[str, Any] = {}
+        
+        # Raw response logs are written in the background so the next turn's API call isn't held up on disk.
+        # Worker threads are joined at interpreter exit, so pending logs are still flushed.
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
         
         self.logger.info(f"Initialized AIAgent - BA: {self.ba_provider}, Coding: {self.coding_provider}")
         
@@ -1153,6 +1336,14 @@ class AIAgent:
         else:
             self.logger.info(f"Coding Agent using Gemini model: {config.coding_gemini_model}")
     
+    def _write_log_async(self, log_file: Path, text: str):
+        """Write a response log file on the I/O pool, reporting failures instead of raising"""
+        def on_done(future):
+            if future.exception() is not None:
+                self.logger.warning(f"Failed to write log file {log_file}: {future.exception()}")
+        
+        self._io_pool.submit(log_file.write_text, text, encoding='utf-8').add_done_callback(on_done)
+    
     def _generate_content(self, prompt: str, max_tokens: int = 65535, agent_type: str = 'ba') -> str:
         """Generate content using the configured AI provider for the specified agent type"""
         if agent_type == 'ba':
@@ -1234,8 +1425,10 @@ class AIAgent:
             else:
                 model_name = self.config.coding_gemini_model
             
-            # Create model instance with appropriate model
-            gemini_model = genai.GenerativeModel(model_name)
+            # Reuse the model instance for this model name
+            gemini_model = self._gemini_models.get(model_name)
+            if gemini_model is None:
+                gemini_model = self._gemini_models[model_name] = genai.GenerativeModel(model_name)
             response = gemini_model.generate_content(prompt)
             return response.text.strip()
             
@@ -1248,17 +1441,15 @@ class AIAgent:
         if not attachments_info:
             return "No attachments provided."
         
-        formatted = []
-        for filename, info in attachments_info.items():
-            try:
-                size = info.get('size', 'unknown size')
-                content_type = info.get('content_type', info.get('mimetype', 'unknown type'))
-                formatted.append(f"- {filename} ({size} bytes, {content_type})")
-            except Exception as e:
-                self.logger.warning(f"Error formatting attachment {filename}: {e}")
-                formatted.append(f"- {filename} (attachment info unavailable)")
-        
-        return "\n".join(formatted)
+        return "\n".join(self._format_attachment_line(filename, info) for filename, info in attachments_info.items())
+    
+    def _format_attachment_line(self, filename: str, info: Dict) -> str:
+        """Format a single attachment entry, falling back to a placeholder for malformed metadata"""
+        try:
+            return f"- {filename} ({info.get('size', 'unknown size')} bytes, {info.get('content_type', info.get('mimetype', 'unknown type'))})"
+        except Exception as e:
+            self.logger.warning(f"Error formatting attachment {filename}: {e}")
+            return f"- {filename} (attachment info unavailable)"
 
     def _extract_json_from_response(self, response_text: str) -> str:
         """Extract JSON content from AI response, handling markdown code fences and other formatting"""
@@ -1266,18 +1457,8 @@ class AIAgent:
         # Remove common markdown patterns
         text = response_text.strip()
         
-        # Remove markdown code fences (````json, ```json, ```, etc.)
-        patterns = [
-            r'^```+\s*json\s*\n',  # Opening: ```json or ````json
-            r'^```+\s*\n',         # Opening: ``` or ````
-            r'\n```+\s*$',         # Closing: ``` or ````
-            r'^```+\s*$',          # Standalone ``` or ````
-            r'```+\s*json\s*',     # Any ```json anywhere
-            r'```+\s*',            # Any ``` anywhere
-        ]
-        
-        for pattern in patterns:
-            text = re.sub(pattern, '', text, flags=re.MULTILINE)
+        # Remove markdown code fences (````json, ```json, ```, etc.) in a single pass
+        text = _FENCE_RE.sub('', text)
         
         # Remove any leading/trailing whitespace after fence removal
         text = text.strip()
@@ -1287,25 +1468,22 @@ class AIAgent:
         json_end = text.rfind('}') + 1
         
         if json_start != -1 and json_end > json_start:
-            json_content = text[json_start:json_end]
-            
-            # Additional cleanup for common JSON formatting issues
-            json_content = json_content.strip()
-            
-            # Remove any trailing commas before closing braces/brackets
-            json_content = re.sub(r',(\s*[}\]])', r'\1', json_content)
-            
-            # Remove any extra characters after the final }
-            final_brace = json_content.rfind('}')
-            if final_brace != -1:
-                json_content = json_content[:final_brace + 1]
-            
-            return json_content
+            # The slice already ends at the final }, so nothing trails it
+            return text[json_start:json_end]
         
         # If no JSON boundaries found, return cleaned text and let JSON parser handle the error
         return text
+    
+    def _parse_json_response(self, json_content: str) -> Any:
+        """Parse extracted response JSON, retrying without trailing commas only if the strict parse fails"""
+        try:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers' handlers still apply
+            return orjson.loads(json_content) if ORJSON_AVAILABLE else json.loads(json_content)
+        except json.JSONDecodeError:
+            # Remove any trailing commas before closing braces/brackets
+            return json.loads(_TRAILING_COMMA_RE.sub(r'\1', json_content))
 
-    def invoke_ba_agent(self, ticket: JiraTicket, instructions: str, codebase: str, 
+    def invoke_ba_agent(self, ticket: JiraTicket, instructions: str, codebase: Iterable[Tuple[str, str]], 
                        temp_artifacts_path: Path, attachments_info: Dict[str, Dict] = None) -> str:
         """Invoke Business Analyst Agent to generate specifications with prompt caching"""
         
@@ -1314,7 +1492,7 @@ class AIAgent:
             static_content = f"""{instructions}
 
 CODEBASE STRUCTURE AND CONTENT:
-{codebase}"""
+{self._format_codebase_for_prompt(codebase, truncate=False)}"""
             
             # Build dynamic content - ticket-specific information
             ticket_context = f"""JIRA TICKET: {ticket.key}
@@ -1322,7 +1500,7 @@ Summary: {ticket.summary}
 Description: {ticket.description}
 
 Comments:
-{chr(10).join([f"- {comment}" for comment in ticket.comments])}"""
+{chr(10).join(f"- {comment}" for comment in ticket.comments)}"""
             
             # Add attachments information if available
             attachments_context = ""
@@ -1352,9 +1530,7 @@ Please provide your business analysis following the markdown format specified in
             
             # Log response to temp artifacts
             ba_log_file = temp_artifacts_path / f"{ticket.key}_ba_response.txt"
-            with open(ba_log_file, 'w', encoding='utf-8') as f:
-                f.write(response_text)
-
+            self._write_log_async(ba_log_file, response_text)
             
             self.logger.info(f"BA Agent response logged to {ba_log_file}")
             self.logger.info("BA Agent generated specification successfully")
@@ -1365,25 +1541,38 @@ Please provide your business analysis following the markdown format specified in
             raise
     
     def invoke_coding_agent_iterative(self, ticket: JiraTicket, ba_spec: str, 
-                                      instructions: str, git_manager: 'GitManager', 
+                                      instructions: str, git_manager: GitManager, 
                                       temp_artifacts_path: Path, attachments_path: Path) -> List[Dict[str, Any]]:
         """Invoke the Coding Agent with iterative conversation approach"""
         
         file_changes = []
-        conversation_history = []  # Track only assistant responses and system messages
+        conversation_history = deque(maxlen=_CODER_HISTORY_MAXLEN)  # Track only recent assistant responses and system messages
         provided_files = {}  # Cache of files already provided to agent {file_path: content}
         file_modification_tracking = {}  # Track if files were modified since last provided
         last_get_file_request = None  # Algorithmic restraint to prevent infinite loops
         last_replace_operation = None  # Track last replace operation to prevent loops
         turn_number = 1
         
+        # The ticket section never changes between turns, so it is built once
+        ticket_context = f"""**ORIGINAL JIRA TICKET:**
+- Key: {ticket.key}
+- Summary: {ticket.summary}
+- Description: {ticket.description}
+- Comments: {chr(10).join(f"- {comment}" for comment in ticket.comments)}"""
+        
+        # The static prompt only changes when a file operation alters the project structure
+        static_content = None
+        static_content_changes = -1
+        
         try:
             while True:
                 self.logger.info(f"Coding Agent conversation turn {turn_number}")
                 
                 # Build context for this turn with project structure but not full content
                 # Separate static (cacheable) from dynamic content
-                static_content = f"""You are an expert Coding Agent. Follow the instructions below to implement the changes specified in the BA specification.
+                if static_content_changes != len(file_changes):
+                    static_content_changes = len(file_changes)
+                    static_content = f"""You are an expert Coding Agent. Follow the instructions below to implement the changes specified in the BA specification.
 
 **INSTRUCTIONS:**
 {instructions}
@@ -1402,11 +1591,7 @@ Please provide your business analysis following the markdown format specified in
 - Work incrementally: examine reference files first, understand patterns, then make targeted changes
 - **For text replacements**: Use regex patterns to find and replace content flexibly, handling variations in whitespace and formatting"""
 
-                dynamic_content = f"""**ORIGINAL JIRA TICKET:**
-- Key: {ticket.key}
-- Summary: {ticket.summary}
-- Description: {ticket.description}
-- Comments: {chr(10).join(f"- {comment}" for comment in ticket.comments)}
+                dynamic_content = f"""{ticket_context}
 
 --- CONVERSATION HISTORY ---
 {chr(10).join(conversation_history) if conversation_history else "No previous conversation."}
@@ -1429,8 +1614,7 @@ Start by requesting the files you need to examine, then make the necessary chang
                 
                 # Log this turn's response
                 turn_log_file = temp_artifacts_path / f"{ticket.key}_coder_turn_{turn_number}.txt"
-                with open(turn_log_file, 'w', encoding='utf-8') as f:
-                    f.write(response_text)
+                self._write_log_async(turn_log_file, response_text)
                 
                 self.logger.info(f"Coding Agent turn {turn_number} response logged to {turn_log_file}")
                 
@@ -1438,12 +1622,15 @@ Start by requesting the files you need to examine, then make the necessary chang
                 is_complete = False
                 completion_summary = ""
                 
-                # Method 1: Plain "CHANGES DONE" string
-                if response_text.strip() == "CHANGES DONE":
+                # The JSON is parsed once here and reused by the operation handling below
+                parsed_response = None
+                
+                # Method 1: Plain "CHANGES DONE" string (response_text is already stripped)
+                if response_text == "CHANGES DONE":
                     is_complete = True
                 
                 # Method 2: "CHANGES DONE" anywhere in the response (case insensitive)
-                elif "CHANGES DONE" in response_text.upper():
+                elif _CHANGES_DONE_RE.search(response_text):
                     is_complete = True
                     # Try to extract summary from plain text format
                     if "Summary:" in response_text:
@@ -1452,9 +1639,9 @@ Start by requesting the files you need to examine, then make the necessary chang
                 
                 # Method 3: JSON with operation "complete"
                 else:
+                    json_content = self._extract_json_from_response(response_text)
                     try:
-                        json_content = self._extract_json_from_response(response_text)
-                        parsed_response = json.loads(json_content)
+                        parsed_response = self._parse_json_response(json_content)
                         if parsed_response.get('operation') == 'complete':
                             # Before accepting completion, validate any HTML files that were modified
                             html_validation_errors = []
@@ -1492,9 +1679,8 @@ Start by requesting the files you need to examine, then make the necessary chang
                 
                 # Extract and parse the operation instruction
                 try:
-                    # Extract JSON from response, handling any surrounding text
-                    json_content = self._extract_json_from_response(response_text)
-                    operation_request = json.loads(json_content)
+                    # Reuse the JSON extracted by the completion check; parsing again surfaces the decode error
+                    operation_request = parsed_response if parsed_response is not None else self._parse_json_response(json_content)
                     
                     # Validate operation format
                     if not self._validate_operation_request(operation_request):
@@ -1502,8 +1688,18 @@ Start by requesting the files you need to examine, then make the necessary chang
                     
                     operation = operation_request.get('operation', 'write_file')
                     
-                    # Handle different operation types
-                    if operation == 'get_file':
+                    # Plain file operations go through the dispatch table; the rest need loop state handled inline
+                    file_operation = self._FILE_OPERATION_HANDLERS.get(operation)
+                    if file_operation is not None:
+                        success, system_message = file_operation(
+                            self, operation_request, git_manager, attachments_path, provided_files, file_modification_tracking
+                        )
+                        if success:
+                            file_changes.append(operation_request)
+                        conversation_history.append(f"ASSISTANT TURN {turn_number}: {response_text}")
+                        conversation_history.append(system_message)
+                    
+                    elif operation == 'get_file':
                         # Handle file request
                         file_path = operation_request.get('file_path')
                         reason = operation_request.get('reason', 'File requested')
@@ -1511,7 +1707,8 @@ Start by requesting the files you need to examine, then make the necessary chang
                         self.logger.info(f"Coding agent requested file: {file_path} - {reason}")
                         
                         # Enhanced redundant file request prevention
-                        file_request_count = sum(1 for turn in conversation_history[-10:] 
+                        recent_history = itertools.islice(conversation_history, max(0, len(conversation_history) - 10), None)
+                        file_request_count = sum(1 for turn in recent_history 
                                                if f"requested file: {file_path}" in turn or 
                                                   f"File '{file_path}' content:" in turn)
                         
@@ -1675,57 +1872,6 @@ Start by requesting the files you need to examine, then make the necessary chang
                             conversation_history.append(f"ASSISTANT TURN {turn_number}: {response_text}")
                             conversation_history.append(f"SYSTEM ERROR: Could not perform find_and_replace in '{file_path}': {str(e)}")
                     
-                    elif operation == 'copy_file':
-                        source_path = operation_request.get('source_path')
-                        target_path = operation_request.get('target_path')
-                        self.logger.info(f"Executing {operation} operation: {source_path} -> {target_path}")
-                        
-                        success = git_manager.copy_file(source_path, target_path, attachments_path)
-                        if success:
-                            file_changes.append(operation_request)
-                            if target_path in provided_files:
-                                del provided_files[target_path]
-                            file_modification_tracking[target_path] = True
-                            conversation_history.append(f"ASSISTANT TURN {turn_number}: {response_text}")
-                            conversation_history.append(f"SYSTEM: {operation} operation for '{source_path}' -> '{target_path}' completed successfully. What is your next action?")
-                        else:
-                            conversation_history.append(f"ASSISTANT TURN {turn_number}: {response_text}")
-                            conversation_history.append(f"SYSTEM ERROR: Failed to copy '{source_path}' to '{target_path}'. Please check the paths and try again.")
-                        
-                    elif operation in ['write_file', 'create_file']:
-                        file_path = operation_request.get('file_path')
-                        # Accept both 'content' and 'file_content' for backward compatibility
-                        file_content = operation_request.get('file_content') or operation_request.get('content', '')
-                        self.logger.info(f"Executing {operation} operation for: {file_path}")
-                        
-                        success = git_manager.write_file_content(file_path, file_content)
-                        if success:
-                            file_changes.append(operation_request)
-                            provided_files[file_path] = file_content
-                            file_modification_tracking[file_path] = True
-                            conversation_history.append(f"ASSISTANT TURN {turn_number}: {response_text}")
-                            conversation_history.append(f"SYSTEM: {operation} operation for '{file_path}' completed successfully. The file content has been updated. What is your next action?")
-                        else:
-                            conversation_history.append(f"ASSISTANT TURN {turn_number}: {response_text}")
-                            conversation_history.append(f"SYSTEM ERROR: Failed to write to file '{file_path}'.")
-                        
-                    elif operation == 'delete_file':
-                        file_path = operation_request.get('file_path')
-                        self.logger.info(f"Executing {operation} operation for: {file_path}")
-                        
-                        success = git_manager.delete_file(file_path)
-                        if success:
-                            file_changes.append(operation_request)
-                            if file_path in provided_files:
-                                del provided_files[file_path]
-                            file_modification_tracking.pop(file_path, None)
-                            conversation_history.append(f"ASSISTANT TURN {turn_number}: {response_text}")
-                            conversation_history.append(f"SYSTEM: {operation} operation for '{file_path}' completed successfully. What is your next action?")
-                        else:
-                            conversation_history.append(f"ASSISTANT TURN {turn_number}: {response_text}")
-                            conversation_history.append(f"SYSTEM ERROR: Failed to delete file '{file_path}'.")
-                    
-                   
                     else:
                         # Unknown operation
                         conversation_history.append(f"ASSISTANT TURN {turn_number}: {response_text}")
@@ -1764,69 +1910,97 @@ Start by requesting the files you need to examine, then make the necessary chang
                 'completion_summary': f'Error: {str(e)}'
             }
     
+    def _copy_file_operation(self, operation_request: Dict, git_manager: GitManager, attachments_path: Path,
+                             provided_files: Dict[str, str], file_modification_tracking: Dict[str, bool]) -> Tuple[bool, str]:
+        """Apply a copy_file operation, returning (success, system message for the conversation)"""
+        source_path = operation_request.get('source_path')
+        target_path = operation_request.get('target_path')
+        self.logger.info(f"Executing copy_file operation: {source_path} -> {target_path}")
+        
+        if not git_manager.copy_file(source_path, target_path, attachments_path):
+            return False, f"SYSTEM ERROR: Failed to copy '{source_path}' to '{target_path}'. Please check the paths and try again."
+        provided_files.pop(target_path, None)
+        file_modification_tracking[target_path] = True
+        return True, f"SYSTEM: copy_file operation for '{source_path}' -> '{target_path}' completed successfully. What is your next action?"
+    
+    def _write_file_operation(self, operation_request: Dict, git_manager: GitManager, attachments_path: Path,
+                              provided_files: Dict[str, str], file_modification_tracking: Dict[str, bool]) -> Tuple[bool, str]:
+        """Apply a write_file/create_file operation, returning (success, system message for the conversation)"""
+        operation = operation_request.get('operation', 'write_file')
+        file_path = operation_request.get('file_path')
+        # Accept both 'content' and 'file_content' for backward compatibility
+        file_content = operation_request.get('file_content') or operation_request.get('content', '')
+        self.logger.info(f"Executing {operation} operation for: {file_path}")
+        
+        if not git_manager.write_file_content(file_path, file_content):
+            return False, f"SYSTEM ERROR: Failed to write to file '{file_path}'."
+        provided_files[file_path] = file_content
+        file_modification_tracking[file_path] = True
+        return True, f"SYSTEM: {operation} operation for '{file_path}' completed successfully. The file content has been updated. What is your next action?"
+    
+    def _delete_file_operation(self, operation_request: Dict, git_manager: GitManager, attachments_path: Path,
+                               provided_files: Dict[str, str], file_modification_tracking: Dict[str, bool]) -> Tuple[bool, str]:
+        """Apply a delete_file operation, returning (success, system message for the conversation)"""
+        file_path = operation_request.get('file_path')
+        self.logger.info(f"Executing delete_file operation for: {file_path}")
+        
+        if not git_manager.delete_file(file_path):
+            return False, f"SYSTEM ERROR: Failed to delete file '{file_path}'."
+        provided_files.pop(file_path, None)
+        file_modification_tracking.pop(file_path, None)
+        return True, f"SYSTEM: delete_file operation for '{file_path}' completed successfully. What is your next action?"
+    
+    # Operation name -> handler for the file operations that don't touch the coder loop's own state
+    _FILE_OPERATION_HANDLERS = {
+        'copy_file': _copy_file_operation,
+        'write_file': _write_file_operation,
+        'create_file': _write_file_operation,
+        'delete_file': _delete_file_operation,
+    }
+    
     def _validate_operation_request(self, operation_request: Dict) -> bool:
         """Validate that operation request has required fields for the specified operation"""
         if not isinstance(operation_request, dict):
             return False
         
         operation = operation_request.get('operation', 'write_file')  # Default to write_file for backward compatibility
+        if not isinstance(operation, str):
+            # A list or dict here would make the table lookup below raise TypeError
+            return False
+        fields = _OPERATION_FIELDS.get(operation)
+        if fields is None:
+            # Unknown operation
+            return False
         
-        # Validate based on operation type
-        if operation == 'get_file':
-            # Get file operations only need file_path
-            file_path = operation_request.get('file_path')
-            return file_path and isinstance(file_path, str)
+        path_fields, text_fields = fields
+        for name in path_fields:
+            value = operation_request.get(name)
+            if not value or not isinstance(value, str):
+                return False
+        for name in text_fields:
+            if not isinstance(operation_request.get(name), str):
+                return False
         
-        elif operation == 'replace_lines':
-            # Replace lines operations need file_path, start_line, end_line, and new_content
-            file_path = operation_request.get('file_path')
+        if operation == 'replace_lines':
             start_line = operation_request.get('start_line')
             end_line = operation_request.get('end_line')
-            new_content = operation_request.get('new_content')
-            return (file_path and isinstance(file_path, str) and
-                   isinstance(start_line, int) and start_line > 0 and
+            return (isinstance(start_line, int) and start_line > 0 and
                    isinstance(end_line, int) and end_line > 0 and
-                   start_line <= end_line and
-                   new_content is not None and isinstance(new_content, str))
+                   start_line <= end_line)
         
-        elif operation in ['write_file', 'create_file']:
-            # These operations require file_path and file_content (or content)
-            file_path = operation_request.get('file_path')
+        if operation in ('write_file', 'create_file'):
+            # These operations accept the content under either key
             file_content = operation_request.get('file_content') or operation_request.get('content')
-            return (file_path and isinstance(file_path, str) and 
-                   file_content is not None and isinstance(file_content, str))
-        
-        elif operation == 'delete_file':
-            # Delete operations only need file_path
-            file_path = operation_request.get('file_path')
-            return file_path and isinstance(file_path, str)
-        
-        elif operation == 'copy_file':
-            # Copy operations need source_path and target_path
-            source_path = operation_request.get('source_path')
-            target_path = operation_request.get('target_path')
-            return (source_path and isinstance(source_path, str) and
-                   target_path and isinstance(target_path, str))
-        
-        elif operation == 'find_and_replace':
-            # Find and replace operations need file_path, find_regex, and replace_text
-            file_path = operation_request.get('file_path')
-            find_regex = operation_request.get('find_regex')
-            replace_text = operation_request.get('replace_text')
-            return (file_path and isinstance(file_path, str) and
-                   find_regex is not None and isinstance(find_regex, str) and
-                   replace_text is not None and isinstance(replace_text, str))
+            return isinstance(file_content, str)
         
-        else:
-            # Unknown operation
-            return False
+        return True
 
     def invoke_coding_agent(self, ticket: JiraTicket, ba_spec: str,
                            instructions: str, codebase: Dict[str, str], temp_artifacts_path: Path) -> List[Dict[str, str]]:
         """Invoke the Coding Agent with comprehensive context (LEGACY - kept for compatibility)"""
         
         # Prepare codebase section for context
-        codebase_section = self._format_codebase_for_prompt(codebase)
+        codebase_section = self._format_codebase_for_prompt(codebase.items())
         
         prompt = f"""You are an expert Coding Agent. Follow the instructions below to implement the changes specified in the BA specification.
 
@@ -1853,8 +2027,7 @@ Based on the BA specification and current codebase, produce ONLY the JSON object
             
             # Log full response to temp_artifacts (before any processing)
             coder_log_file = temp_artifacts_path / f"{ticket.key}_coder_response.txt"
-            with open(coder_log_file, 'w', encoding='utf-8') as f:
-                f.write(response_text)
+            self._write_log_async(coder_log_file, response_text)
             
             self.logger.info(f"Coding Agent response logged to {coder_log_file}")
             
@@ -1865,7 +2038,7 @@ Based on the BA specification and current codebase, produce ONLY the JSON object
             cleaned_json = self._fix_unescaped_quotes(json_content)
             
             # Parse JSON response
-            changes = json.loads(cleaned_json)
+            changes = self._parse_json_response(cleaned_json)
             self.logger.info("Coding Agent generated changes successfully")
             return changes
             
@@ -1878,22 +2051,20 @@ Based on the BA specification and current codebase, produce ONLY the JSON object
             self.logger.error(f"Coding Agent invocation failed: {e}")
             raise
     
-    def _format_codebase_for_prompt(self, codebase: Dict[str, str]) -> str:
-        """Format codebase contents for AI prompt"""
-        sections = []
-        
-        for file_path, content in codebase.items():
-            # Truncate very long files to prevent token limits
-            if len(content) > 10000:
-                content = content[:10000] + f"\n\n... [FILE TRUNCATED - {len(content)} total characters] ..."
-            
-            sections.append(f"""---
-FILE: {file_path}
----
-{content}
-""")
+    def _format_codebase_for_prompt(self, codebase: Iterable[Tuple[str, str]], truncate: bool = True) -> str:
+        """Format (path, content) pairs for AI prompt, consuming them as they arrive"""
+        # Each file becomes one section string, and all sections are joined in a single pass
+        return "\n".join(self._format_codebase_file(file_path, content, truncate)
+                         for file_path, content in codebase)
+    
+    def _format_codebase_file(self, file_path: str, content: str, truncate: bool = True) -> str:
+        """Format a single file's section of the codebase prompt"""
+        # Truncate very long files to prevent token limits
+        content_length = len(content)
+        if truncate and content_length > 10000:
+            content = f"{content[:10000]}\n\n... [FILE TRUNCATED - {content_length} total characters] ..."
         
-        return "\n".join(sections)
+        return f"---\nFILE: {file_path}\n---\n{content}\n"
 
     def _build_cacheable_prompt(self, static_content: str, dynamic_content: str, agent_type: str = 'ba') -> dict:
         """Build a prompt structure optimized for Claude prompt caching"""
@@ -1944,23 +2115,18 @@ class LocalServerManager:
     
     def is_port_available(self) -> bool:
         """Check if the specified port is available"""
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('localhost', self.port))
-                return True
-        except OSError:
-            return False
+        return is_port_available(self.port)
     
     def find_available_port(self) -> int:
-        """Find an available port starting from the preferred port"""
-        for port in range(self.port, self.port + 100):
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    s.bind(('localhost', port))
-                    return port
-            except OSError:
-                continue
-        raise Exception("No available ports found")
+        """Find an available port, letting the kernel pick one"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            # Port 0 asks the kernel for a free ephemeral port in a single bind
+            s.bind(('localhost', 0))
+            return s.getsockname()[1]
+    
+    def cleanup_port(self):
+        """Kill any existing processes listening on the port (Windows only)"""
+        kill_port_listeners(self.port, self.logger)
     
     def start_server(self) -> str:
         """Start the local development server"""
@@ -1969,12 +2135,9 @@ class LocalServerManager:
             if not self.workspace_path.exists():
                 raise Exception(f"Workspace directory does not exist: {self.workspace_path}")
             
-            # Kill any existing processes on the port (more aggressive cleanup)
-            self.logger.info(f"Cleaning up any existing processes on port {self.port}")
-            os.system(f"netstat -ano | findstr :{self.port} > nul && (for /f \"tokens=5\" %a in ('netstat -ano ^| findstr :{self.port} ^| findstr LISTENING') do taskkill /f /pid %a 2>nul) || echo No processes found on port {self.port}")
-            
-            # Wait a moment for cleanup
-            time.sleep(0.5)
+            # Kill any existing processes on the port, but only if something actually holds it
+            if not self.is_port_available():
+                self.cleanup_port()
             
             # Find available port
             if not self.is_port_available():
@@ -1984,10 +2147,10 @@ class LocalServerManager:
             
             # Create server, passing the workspace_path explicitly to the handler
             try:
-                # This lambda creates a handler that serves files from the specified directory
-                # without changing the current working directory of the script.
-                handler = lambda *args, **kwargs: SimpleHTTPRequestHandler(*args, directory=self.workspace_path.as_posix(), **kwargs)
-                self.server = HTTPServer(('localhost', self.port), handler)
+                # Serve files from the specified directory without changing the current
+                # working directory of the script.
+                handler = functools.partial(DevRequestHandler, directory=self.workspace_path.as_posix())
+                self.server = DevHTTPServer(('localhost', self.port), handler)
                 self.logger.info(f"Created HTTP server on localhost:{self.port}, serving from {self.workspace_path.absolute()}")
             except Exception as e:
                 self.logger.error(f"Failed to create HTTP server: {e}")
@@ -2004,21 +2167,23 @@ class LocalServerManager:
             self.server_thread = threading.Thread(target=run_server, daemon=True)
             self.server_thread.start()
             
-            # Give server more time to start and verify it's running
-            time.sleep(2)
-            
             # Verify server is actually running
             if not self.server_thread.is_alive():
                 raise Exception("Server thread failed to start")
             
-            # Test if server is responding
+            # Poll until the server accepts connections instead of sleeping a fixed amount.
+            # A TCP connect is enough here; a full HTTP GET would also render the directory listing.
             server_url = f"http://localhost:{self.port}"
-            try:
-                import urllib.request
-                urllib.request.urlopen(server_url, timeout=5)
-                self.logger.info(f"Server verified and responding at {server_url}")
-            except Exception as e:
-                self.logger.warning(f"Server may not be responding yet: {e}")
+            for attempt in range(20):
+                try:
+                    socket.create_connection(('localhost', self.port), timeout=0.2).close()
+                    self.logger.info(f"Server verified and accepting connections at {server_url}")
+                    break
+                except Exception as e:
+                    if attempt == 19:
+                        self.logger.warning(f"Server may not be responding yet: {e}")
+                    else:
+                        time.sleep(0.05)
             
             self.logger.info(f"Local development server started at {server_url}")
             return server_url
@@ -2047,6 +2212,54 @@ class LocalServerManager:
         return None
 
 
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the date/time part of %(asctime)s once per second instead of once per record"""
+    
+    def __init__(self, fmt: Optional[str] = None):
+        super().__init__(fmt)
+        # (whole second, formatted '%Y-%m-%d %H:%M:%S'), replaced as one tuple so threads never see a torn pair
+        self._second_cache: Tuple[int, str] = (-1, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._second_cache
+        if cached_second != second:
+            formatted = time.strftime(self.default_time_format, self.converter(record.created))
+            self._second_cache = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that batches log writes, flushing on errors or when a record arrives a few seconds after the last flush"""
+    buffer_size = 1 << 16
+    flush_interval = 5.0
+    
+    def __init__(self, filename, mode: str = 'a', encoding: Optional[str] = None):
+        self._last_flush = time.monotonic()
+        super().__init__(filename, mode, encoding)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=self.buffer_size)
+    
+    def emit(self, record: logging.LogRecord):
+        # StreamHandler.emit flushes after every record; here that only happens for errors or once per interval.
+        # close() (run by logging.shutdown at exit) flushes whatever is still buffered.
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            now = time.monotonic()
+            if record.levelno >= logging.ERROR or now - self._last_flush >= self.flush_interval:
+                self.stream.flush()
+                self._last_flush = now
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
 class OrchestratorScript:
     """Main orchestrator class that coordinates the entire workflow"""
     
@@ -2056,63 +2269,99 @@ class OrchestratorScript:
         temp_artifacts_path = Path("temp_artifacts")
         attachments_path = Path("attachments")
         
+        def remove_entry(entry: os.DirEntry):
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+                # No logging here since logger isn't set up yet
+            except OSError:
+                # Silently continue - we'll log properly later
+                pass
+        
+        entries = []
         for path in [temp_artifacts_path, attachments_path]:
             if not path.exists():
                 continue
             
-            for item in path.iterdir():
-                try:
-                    if item.is_file() or item.is_symlink():
-                        item.unlink()
-                    elif item.is_dir():
-                        shutil.rmtree(item)
-                    # No logging here since logger isn't set up yet
-                except OSError:
-                    # Silently continue - we'll log properly later
-                    pass
+            # scandir entries carry their file type, so no extra stat per item
+            with os.scandir(path) as it:
+                entries.extend(it)
+        
+        if not entries:
+            return
+        
+        # Deletions are independent syscalls that release the GIL, so spread them over a small pool
+        with ThreadPoolExecutor(max_workers=min(8, len(entries))) as executor:
+            # Drain the iterator so every removal has finished before logging starts
+            list(executor.map(remove_entry, entries))
     
     def __init__(self):
-        self.setup_logging()
-        self.logger = logging.getLogger(__name__)
-        
         # Create temp_artifacts directory for logs and generated files
         self.temp_artifacts_path = Path("temp_artifacts")
         self.temp_artifacts_path.mkdir(exist_ok=True)
         
+        self.setup_logging()
+        self.logger = logging.getLogger(__name__)
+        
         # Create attachments directory for Jira ticket attachments
         self.attachments_path = Path("attachments")
         self.attachments_path.mkdir(exist_ok=True)
         
         try:
+            # Only Jira is needed before we know there is a ticket; the other managers are built on first use
             self.config = ConfigManager()
             self.jira_manager = JiraManager(self.config)
-            self.git_manager = GitManager(self.config)
-            self.ai_agent = AIAgent(self.config)
-            self.instruction_manager = InstructionManager()
             self.server_manager = None
+            # Non-critical Jira status updates, posted together as one comment
+            self._pending_comments: List[str] = []
         except Exception as e:
             self.logger.error(f"Failed to initialize orchestrator: {e}")
             sys.exit(1)
     
+    @functools.cached_property
+    def git_manager(self) -> GitManager:
+        return GitManager(self.config)
+    
+    @functools.cached_property
+    def ai_agent(self) -> AIAgent:
+        return AIAgent(self.config)
+    
+    @functools.cached_property
+    def instruction_manager(self) -> InstructionManager:
+        return InstructionManager()
+    
     def setup_logging(self):
-        """Configure logging"""
-        # Ensure temp_artifacts directory exists
-        temp_artifacts_path = Path("temp_artifacts")
-        temp_artifacts_path.mkdir(exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler(temp_artifacts_path / 'orchestrator.log')
-            ]
-        )
+        """Configure logging into the temp_artifacts directory created by __init__"""
+        # One formatter shared by both handlers, so each record's timestamp is rendered once per second at most
+        formatter = CachedTimeFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.StreamHandler(sys.stdout),
+            BufferedFileHandler(self.temp_artifacts_path / 'orchestrator.log')
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        logging.basicConfig(level=logging.INFO, handlers=handlers)
+    
+    def _queue_comment(self, comment: str):
+        """Queue a Jira comment to be posted with the other status updates of this run"""
+        self._pending_comments.append(comment)
+    
+    def _flush_comments(self, ticket_key: str):
+        """Post all queued comments to the ticket in a single request"""
+        if not self._pending_comments:
+            return
+        comment = "\n\n----\n\n".join(self._pending_comments)
+        self._pending_comments.clear()
+        self.jira_manager.add_comment(ticket_key, comment)
     
     def handle_failure(self, ticket_key: str, error_message: str):
         """Handle failure by updating Jira ticket"""
         try:
-            self.jira_manager.add_comment(ticket_key, f"Automated processing failed: {error_message}")
+            self._queue_comment(f"Automated processing failed: {error_message}")
+            self._flush_comments(ticket_key)
             # Transition to "Pending" on failure/error (allows for retry)
             self.jira_manager.transition_ticket(ticket_key, "Pending")
             self.logger.info(f"Successfully transitioned ticket {ticket_key} to Pending")
@@ -2127,14 +2376,9 @@ class OrchestratorScript:
     def _has_uncommitted_changes(self) -> bool:
         """Check if there are any uncommitted changes in the Git repository"""
         try:
-            # Check for staged changes
-            staged_changes = bool(self.git_manager.repo.git.diff('--cached'))
-            # Check for unstaged changes
-            unstaged_changes = bool(self.git_manager.repo.git.diff())
-            # Check for untracked files
-            untracked_files = bool(self.git_manager.repo.git.ls_files('--others', '--exclude-standard'))
-            
-            return staged_changes or unstaged_changes or untracked_files
+            # One status call covers staged, unstaged and untracked (non-ignored) files.
+            # Untracked directories are reported as a single entry, which is all we need here.
+            return bool(self.git_manager.repo.git.status('--porcelain=v1', '--untracked-files=normal'))
         except Exception as e:
             self.logger.warning(f"Error checking for uncommitted changes: {e}")
             return False
@@ -2142,53 +2386,56 @@ class OrchestratorScript:
     def _clean_old_workspaces(self):
         """Deletes old workspace directories based on a predefined pattern."""
         self.logger.info("Starting to clean old workspace directories.")
-        current_dir = Path(".")
         
-        for item in current_dir.iterdir():
-            if item.is_dir() and (item.name.startswith("workspace") or item.name == "workspace"):
-                self.logger.info(f"Attempting to delete old workspace: {item.name}")
-                
-                # First, try to cleanup any Git repository in the directory
-                try:
-                    if (item / ".git").exists():
-                        self.logger.info(f"Found Git repository in {item.name}, cleaning up Git processes...")
-                        # Try to close any open Git repository
-                        try:
-                            temp_repo = Repo(str(item))
-                            temp_repo.close()
-                            del temp_repo
-                        except:
-                            pass
-                        
-                        # Force kill any git processes that might be locking files
-                        os.system("taskkill /f /im git.exe 2>nul")
-                        os.system("taskkill /f /im python.exe /fi \"WINDOWTITLE eq *workspace*\" 2>nul")
-                        time.sleep(0.5)
-                except Exception as e:
-                    self.logger.warning(f"Error during Git cleanup for {item.name}: {e}")
-                
-                # Now try to delete the directory
-                try:
-                    # On Windows, use rmdir with force flag via system command as fallback
-                    if os.name == 'nt':  # Windows
-                        result = os.system(f'rmdir /s /q "{item}"')
-                        if result == 0:
-                            self.logger.info(f"Successfully deleted {item.name} using system command")
-                        else:
-                            # Fallback to Python shutil
-                            shutil.rmtree(item, ignore_errors=True)
-                            if not item.exists():
-                                self.logger.info(f"Successfully deleted {item.name} using shutil fallback")
-                            else:
-                                self.logger.error(f"Failed to delete {item.name} - directory may be in use")
-                    else:
-                        # Non-Windows systems
-                        shutil.rmtree(item)
-                        self.logger.info(f"Successfully deleted {item.name}")
-                        
-                except OSError as e:
-                    self.logger.error(f"Failed to delete {item.name}: {e}")
-                    self.logger.error(f"Please manually delete the directory or ensure no processes are using files within it")
+        # scandir entries carry their file type, so matching needs no extra stat per item
+        with os.scandir(".") as it:
+            workspaces = [
+                Path(entry.path) for entry in it
+                if entry.name.startswith("workspace") and entry.is_dir(follow_symlinks=False)
+            ]
+        
+        if not workspaces:
+            return
+        
+        # Each rmtree is an independent directory walk, so the deletions overlap on a small pool
+        with ThreadPoolExecutor(max_workers=min(4, len(workspaces))) as executor:
+            errors = list(executor.map(self._delete_workspace, workspaces))
+            failed = [(item, error) for item, error in zip(workspaces, errors) if error is not None]
+            
+            # Only when a file was locked, kill git processes that might hold it (once, not per directory) and retry
+            if os.name == 'nt' and any(isinstance(error, PermissionError) for _, error in failed):
+                self.logger.info("Old workspaces are locked, cleaning up Git processes...")
+                os.system("taskkill /f /im git.exe 2>nul")
+                os.system("taskkill /f /im python.exe /fi \"WINDOWTITLE eq *workspace*\" 2>nul")
+                time.sleep(0.5)
+                retry_items = [item for item, _ in failed]
+                failed = [
+                    (item, error) for item, error in zip(retry_items, executor.map(self._delete_workspace, retry_items))
+                    if error is not None
+                ]
+        
+        for item, error in failed:
+            self.logger.error(f"Failed to delete {item.name}: {error}")
+            self.logger.error(f"Please manually delete the directory or ensure no processes are using files within it")
+    
+    def _delete_workspace(self, item: Path) -> Optional[OSError]:
+        """Delete a single old workspace directory, returning the error instead of raising if it fails"""
+        self.logger.info(f"Attempting to delete old workspace: {item.name}")
+        
+        def clear_readonly_and_retry(func, path, _):
+            # Git marks pack and object files read-only, which Windows refuses to delete
+            os.chmod(path, stat.S_IWRITE)
+            func(path)
+        
+        try:
+            if sys.version_info >= (3, 12):
+                shutil.rmtree(item, onexc=clear_readonly_and_retry)
+            else:
+                shutil.rmtree(item, onerror=clear_readonly_and_retry)
+            self.logger.info(f"Successfully deleted {item.name}")
+            return None
+        except OSError as e:
+            return e
 
     def run(self):
         """Main execution logic"""
@@ -2206,6 +2453,14 @@ class OrchestratorScript:
             if not ticket:
                 self.logger.info("No open tickets found. Exiting.")
                 return
+            
+            # Build the AI clients now that there is work, so a misconfiguration still stops
+            # the script before the ticket is touched
+            try:
+                self.ai_agent
+            except Exception as e:
+                self.logger.error(f"Failed to initialize orchestrator: {e}")
+                sys.exit(1)
 
             # Transition ticket to "In Progress" as soon as it's picked up
             self.jira_manager.transition_ticket(ticket.key, "In Progress")
@@ -2239,9 +2494,11 @@ class OrchestratorScript:
             # Note: Branch comment will be added AFTER successful push to remote
             self.logger.info(f"Created feature branch: {feature_branch_name}")
             
-            # 4. Load full codebase context for BA Agent only
+            # 4. Stream full codebase context for BA Agent only
+            # Files are formatted into the prompt as they are read, rather than first collected
+            # into a dict that would stay alive for the rest of the run
             self.logger.info("Loading complete codebase context for BA Agent")
-            codebase_contents = self.git_manager.get_all_file_contents()
+            codebase_contents = self.git_manager.iter_file_contents()
             
             # 5. Load instruction files
             self.logger.info("Loading instruction files")
@@ -2283,7 +2540,8 @@ class OrchestratorScript:
             self.logger.info("Committing changes")
             try:
                 # Only commit if we have some changes (either from successful operations or existing uncommitted changes)
-                if coding_changes or self._has_uncommitted_changes():
+                had_changes_to_commit = bool(coding_changes) or self._has_uncommitted_changes()
+                if had_changes_to_commit:
                     # Commit changes
                     commit_message = f"feat({ticket.key}): {ticket.summary}"
                     if completion_summary:
@@ -2294,21 +2552,18 @@ class OrchestratorScript:
                     # Push branch
                     self.git_manager.push_branch(feature_branch_name)
                     
-                    # Add final comment to Jira
+                    # Queue final comment for Jira; the ticket is resolved in step 10
                     final_comment = f"""Development complete and pushed to branch: `{feature_branch_name}`
                     
 **Completion Summary:**
 {completion_summary if completion_summary else 'No summary provided.'}
 """
-                    self.jira_manager.add_comment(ticket.key, final_comment)
-                    
-                    # Transition ticket to "Resolved"
-                    self.jira_manager.transition_ticket(ticket.key, "Resolved")
+                    self._queue_comment(final_comment)
                     
                 else:
                     self.logger.info("No changes were made by the coding agent. Nothing to commit.")
-                    # Add a comment to Jira indicating no changes were made
-                    self.jira_manager.add_comment(ticket.key, "Coding agent made no changes to the codebase.")
+                    # Note in Jira that no changes were made
+                    self._queue_comment("Coding agent made no changes to the codebase.")
 
             except Exception as e:
                 self.handle_failure(ticket.key, f"Failed to commit or push changes: {str(e)}")
@@ -2323,7 +2578,7 @@ class OrchestratorScript:
                 
                 # Add server info to Jira comment
                 server_comment = f"Local development server started at: {server_url}\n\nYou can now test the changes locally before reviewing the pull request."
-                self.jira_manager.add_comment(ticket.key, server_comment)
+                self._queue_comment(server_comment)
                 
             except Exception as e:
                 self.logger.error(f"Failed to start local server: {e}")
@@ -2331,21 +2586,15 @@ class OrchestratorScript:
                 
                 # Add fallback comment to Jira
                 fallback_comment = f"Implementation completed successfully but local server failed to start.\n\nPlease test the changes manually in the workspace directory: {self.git_manager.workspace_path}"
-                self.jira_manager.add_comment(ticket.key, fallback_comment)
+                self._queue_comment(fallback_comment)
             
             # 10. Finalize and Report
             self.logger.info("Finalizing and updating Jira ticket")
             try:
-                # Initialize commit_message with a default value in case no commit was made
-                commit_message = f"feat({ticket.key}): {ticket.summary} (No new changes to commit)"
-                if 'commit_message' in locals() and commit_message: # Check if a real commit message was set
-                    pass # Keep the real one
-                
-                # We need to re-capture the commit message if it was created inside the try block
-                if coding_changes or self._has_uncommitted_changes():
-                    commit_message = f"feat({ticket.key}): {ticket.summary}"
-                    if completion_summary:
-                        commit_message += f" - {completion_summary}"
+                # Step 8 already decided whether to commit and built the message; the tree is clean
+                # after committing, so there is no need to ask git again
+                if not had_changes_to_commit:
+                    commit_message = f"feat({ticket.key}): {ticket.summary} (No new changes to commit)"
 
                 # Add completion summary if provided
                 summary_section = ""
@@ -2358,15 +2607,18 @@ class OrchestratorScript:
 **Commit:** {commit_message}
 **Local Server:** {server_url if server_url else 'Not available'}{summary_section}
 Ready for review and testing."""
-                
-                self.jira_manager.add_comment(ticket.key, completion_comment)
+                self._queue_comment(completion_comment)
                 
                 # Jira Status Transition Rules:
                 # - "In Progress": Set when ticket is picked up (line 1835)
                 # - "Resolved": Set on successful implementation completion
                 # - "Pending": Set on failure/error (handled in handle_failure method)
-                self.jira_manager.transition_ticket(ticket.key, "Resolved")
-                self.logger.info(f"Successfully transitioned ticket {ticket.key} to Resolved")
+                try:
+                    self.jira_manager.transition_ticket(ticket.key, "Resolved")
+                    self.logger.info(f"Successfully transitioned ticket {ticket.key} to Resolved")
+                finally:
+                    # One REST call for all of this run's status updates, posted even if the transition failed
+                    self._flush_comments(ticket.key)
                 
                 self.logger.info(f"Successfully processed ticket {ticket.key}")
                 
@@ -2374,13 +2626,16 @@ Ready for review and testing."""
                 if self.server_manager and server_url:
                     self.logger.info(f"Local server will continue running at {server_url}")
                     self.logger.info("Press Ctrl+C to stop the server and exit")
+                    # Nothing else is logged while waiting, so write out what the file handler has buffered
+                    for handler in logging.getLogger().handlers:
+                        handler.flush()
                     
                     try:
-                        # Keep the main thread alive while server runs
-                        while True:
-                            time.sleep(60)  # Check every minute
-                            if not self.server_manager.server_thread.is_alive():
-                                break
+                        # Keep the main thread alive while server runs, returning as soon as it stops.
+                        # A bounded join keeps Ctrl+C working on Windows, where an untimed join isn't interruptible.
+                        server_thread = self.server_manager.server_thread
+                        while server_thread.is_alive():
+                            server_thread.join(timeout=1)
                     except KeyboardInterrupt:
                         self.logger.info("Received shutdown signal")
                         self.server_manager.stop_server()
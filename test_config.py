@@ -6,7 +6,9 @@ Tests the get_file_content and replace_file_lines methods.
 
 import sys
 import logging
+import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from start import GitManager, ConfigManager
 
 def test_new_file_operations():
@@ -101,6 +103,25 @@ Line 5: Final line"""
         Path("test_file.txt").unlink(missing_ok=True)
         return False
 
+def test_env_files_excluded_from_codebase():
+    """Environment files anywhere in the workspace must never be read into the AI prompt"""
+    with tempfile.TemporaryDirectory() as workspace:
+        workspace_path = Path(workspace)
+        (workspace_path / "config").mkdir()
+        (workspace_path / "deploy").mkdir()
+        (workspace_path / "app.py").write_text("print('hello')\n")
+        (workspace_path / ".env").write_text("SECRET=root\n")
+        (workspace_path / "config" / "production.env").write_text("SECRET=production\n")
+        (workspace_path / "deploy" / "staging.ENV").write_text("SECRET=staging\n")
+        (workspace_path / "deploy" / ".env.json").write_text('{"SECRET": "json"}\n')
+        
+        # Only workspace_path is read from the config for the file walk
+        git_manager = GitManager(SimpleNamespace(git_workspace_path=workspace))
+        file_contents = dict(git_manager.iter_file_contents())
+    
+    assert list(file_contents) == ["app.py"]
+    assert not any("SECRET" in content for content in file_contents.values())
+
 if __name__ == "__main__":
     success = test_new_file_operations()
     sys.exit(0 if success else 1) 
\ No newline at end of file